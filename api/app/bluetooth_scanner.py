@@ -1,168 +1,246 @@
+import asyncio
+import logging
+import re
+import signal
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from app.config import settings
+
+__all__ = ["BLUETOOTH_AVAILABLE", "BluetoothScanner", "bluetooth_scanner"]
+
+logger = logging.getLogger(__name__)
 
 try:
-    import bluepy3.btle as btle
+    from bleak import BleakScanner
     BLUETOOTH_AVAILABLE = True
 except ImportError:
-    print("Warning: bluepy3 not available - Bluetooth scanning disabled")
+    logger.warning("bleak not available - Bluetooth scanning disabled")
     BLUETOOTH_AVAILABLE = False
-    btle = None
+    BleakScanner = None
+
+# Patterns for parsing raw `hcitool lescan` output lines, e.g. b"AA:BB:CC:DD:EE:FF MEATER"
+_MAC_RE = re.compile(rb'([0-9A-F]{2}(?::[0-9A-F]{2}){5})', re.IGNORECASE)
+_MEATER_RE = re.compile(rb'meater', re.IGNORECASE)
 
 
 class BluetoothScanner:
     """
     Bluetooth Low Energy device scanner for finding Meater probes
     """
-    
-    def __init__(self):
-        self.scanner = None
-        
-    def scan_for_meater_devices(self, scan_time: float = 5.0) -> List[str]:
+
+    def __init__(self, classic_adapter: Optional[str] = None):
+        # HCI adapter for the hcitool fallback (e.g. "hci1"). When set, the fallback runs
+        # concurrently with the Bleak scan instead of after it.
+        self.classic_adapter = classic_adapter
+
+        # Serializes scans so concurrent callers share the adapter instead of fighting over it
+        self._scan_lock = asyncio.Lock()
+
+        # Recently discovered Meater addresses -> last-seen time (time.monotonic)
+        self._cache: Dict[str, float] = {}
+        self._cache_ttl = 30.0
+
+    def _remember(self, address: str) -> None:
+        """Record a discovered Meater address in the cache"""
+        self._cache[address] = time.monotonic()
+
+    def _fresh_cached_devices(self) -> List[str]:
+        """Prune expired cache entries and return the addresses still fresh"""
+        cutoff = time.monotonic() - self._cache_ttl
+        for address in [a for a, seen in self._cache.items() if seen < cutoff]:
+            del self._cache[address]
+        return list(self._cache)
+
+    def invalidate_cache(self) -> None:
+        """Forget all cached devices (e.g. after a failed connect)"""
+        self._cache.clear()
+
+    async def scan_for_meater_devices(self, scan_time: float = 1.5, target: Optional[int] = None) -> List[str]:
         """
         Scan for Meater devices and return their MAC addresses
-        
+
         Args:
             scan_time: How long to scan in seconds
-            
+            target: Stop scanning early once this many Meaters are found (None scans the full window)
+
         Returns:
             List of MAC addresses for discovered Meater devices
         """
         if not BLUETOOTH_AVAILABLE:
-            print("Bluetooth not available - cannot scan for devices")
+            logger.warning("Bluetooth not available - cannot scan for devices")
             return []
-        
-        # Try primary scanning method
-        devices = self._scan_primary(scan_time)
-        if devices:
-            return devices
-            
-        # If primary fails, try alternative method
-        print("Primary scan failed, trying alternative approach...")
-        return self._scan_alternative(scan_time)
-    
-    def _scan_primary(self, scan_time: float) -> List[str]:
-        """Primary scanning method using bluepy3 Scanner"""
+
+        async with self._scan_lock:
+            # Reuse recent discoveries rather than rescanning for the same probe
+            if scan_time <= self._cache_ttl:
+                cached = self._fresh_cached_devices()
+                if cached and len(cached) >= (target or 1):
+                    logger.debug("Using cached Meater devices: %s", cached)
+                    return cached
+
+            if self.classic_adapter:
+                return await self._scan_concurrently(scan_time, target)
+
+            # Try primary scanning method
+            devices = await self._scan_primary(scan_time, target)
+            if devices:
+                return devices
+
+            # If primary fails, try alternative method
+            logger.info("Primary scan failed, trying alternative approach...")
+            return await self._scan_alternative(scan_time)
+
+    async def _scan_concurrently(self, scan_time: float, target: Optional[int] = None) -> List[str]:
+        """Run both scan methods at once and return the first one that finds a Meater"""
+        pending = {
+            asyncio.create_task(self._scan_primary(scan_time, target)),
+            asyncio.create_task(self._scan_alternative(scan_time)),
+        }
         try:
-            # Create scanner
-            self.scanner = btle.Scanner()
-            
-            print(f"Scanning for Meater devices for {scan_time} seconds...")
-            
-            # Scan for devices
-            devices = self.scanner.scan(scan_time)
-            
-            meater_devices = []
-            
-            for device in devices:
-                # Check if device name contains "MEATER"
-                device_name = ""
-                
-                # Look through scan data for device name
-                for (adtype, description, value) in device.getScanData():
-                    if adtype == 8 or adtype == 9:  # Short Local Name or Complete Local Name
-                        device_name = value
-                        break
-                
-                # Check if this is a Meater device
-                if "meater" in device_name.lower():
-                    print(f"Found Meater device: {device.addr} ({device_name})")
-                    meater_devices.append(device.addr.upper())
-                    
-            if not meater_devices:
-                print("No Meater devices found with primary scan")
-                
-            return meater_devices
-            
-        except Exception as e:
-            print(f"Error in primary scan: {e}")
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    devices = task.result()
+                    if devices:
+                        return devices
             return []
         finally:
-            if self.scanner:
+            # Cancel the losing scan so it releases the adapter
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _scan_primary(self, scan_time: float, target: Optional[int] = None) -> List[str]:
+        """Primary scanning method using Bleak's BleakScanner"""
+        meater_devices: List[str] = []
+        target_reached = asyncio.Event()
+
+        def detection_callback(device, advertisement_data):
+            device_name = advertisement_data.local_name or device.name or ""
+            address = device.address.upper()
+
+            # Check if this is a Meater device
+            if "meater" in device_name.lower() and address not in meater_devices:
+                logger.info("Found Meater device: %s (%s)", address, device_name)
+                meater_devices.append(address)
+                self._remember(address)
+                if target and len(meater_devices) >= target:
+                    target_reached.set()
+
+        try:
+            logger.debug("Scanning for Meater devices for %s seconds...", scan_time)
+
+            # Active scanning requests scan responses, which carry the Meater's name
+            async with BleakScanner(detection_callback=detection_callback, scanning_mode="active"):
                 try:
-                    self.scanner.stop()
-                except:
+                    await asyncio.wait_for(target_reached.wait(), timeout=scan_time)
+                except asyncio.TimeoutError:
                     pass
-                self.scanner = None
-    
-    def _scan_alternative(self, scan_time: float) -> List[str]:
+
+            if not meater_devices:
+                logger.debug("No Meater devices found with primary scan")
+
+            return meater_devices
+
+        except Exception as e:
+            logger.warning("Error in primary scan: %s", e)
+            return []
+
+    async def _scan_alternative(self, scan_time: float) -> List[str]:
         """Alternative scanning method without requiring BLE management"""
+        proc = None
         try:
-            import subprocess
-            import re
-            
-            print("Using alternative Bluetooth scanning via hcitool...")
-            
-            # Use hcitool lescan for BLE devices
-            cmd = ["timeout", str(int(scan_time)), "hcitool", "lescan"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=scan_time + 2)
-            
+            logger.debug("Using alternative Bluetooth scanning via hcitool...")
+
+            # Use hcitool lescan for BLE devices; it runs until terminated below
+            cmd = ["hcitool"]
+            if self.classic_adapter:
+                cmd += ["-i", self.classic_adapter]
+            cmd.append("lescan")
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+
             meater_devices = []
-            
-            # Parse output for Meater devices
-            for line in result.stdout.split('\n'):
-                if 'meater' in line.lower():
-                    # Extract MAC address from line like "AA:BB:CC:DD:EE:FF MEATER"
-                    mac_match = re.search(r'([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})', line)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + scan_time
+
+            # Parse output as it arrives and stop at the first Meater device
+            while not meater_devices:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    line = await asyncio.wait_for(proc.stdout.readline(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    break
+
+                if _MEATER_RE.search(line):
+                    mac_match = _MAC_RE.search(line)
                     if mac_match:
-                        mac_addr = mac_match.group(1).upper()
-                        print(f"Found Meater device (alternative): {mac_addr}")
+                        mac_addr = mac_match.group(1).decode().upper()
+                        logger.info("Found Meater device (alternative): %s", mac_addr)
                         meater_devices.append(mac_addr)
-            
+                        self._remember(mac_addr)
+
             if not meater_devices:
-                print("No Meater devices found with alternative scan")
-                
+                logger.debug("No Meater devices found with alternative scan")
+
             return meater_devices
-            
+
         except Exception as e:
-            print(f"Error in alternative scan: {e}")
+            logger.warning("Error in alternative scan: %s", e)
             return []
-    
-    def get_device_info(self, address: str) -> Dict[str, Any]:
+        finally:
+            # SIGINT lets hcitool disable LE scanning on the adapter before exiting
+            if proc is not None and proc.returncode is None:
+                proc.send_signal(signal.SIGINT)
+                await proc.wait()
+
+    async def get_device_info(self, address: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific device
-        
+
         Args:
             address: MAC address of the device
-            
+
         Returns:
             Dictionary with device information
         """
         if not BLUETOOTH_AVAILABLE:
             return {}
-            
+
         try:
-            self.scanner = btle.Scanner()
-            devices = self.scanner.scan(3.0)  # Short scan
-            
-            for device in devices:
-                if device.addr.upper() == address.upper():
-                    info = {
-                        'address': device.addr.upper(),
-                        'rssi': device.rssi,
-                        'connectable': device.connectable,
-                        'scan_data': {}
-                    }
-                    
-                    # Extract scan data
-                    for (adtype, description, value) in device.getScanData():
-                        info['scan_data'][description] = value
-                        
-                    return info
-                    
-            return {}
-            
+            async with self._scan_lock:
+                discovered = await BleakScanner.discover(timeout=3.0, return_adv=True)  # Short scan
+
+            for device, advertisement_data in discovered.values():
+                if device.address.upper() == address.upper():
+                    break
+            else:
+                return {}
+
+            return {
+                'address': device.address.upper(),
+                'rssi': advertisement_data.rssi,
+                'name': advertisement_data.local_name or device.name,
+                'scan_data': {
+                    'manufacturer_data': {
+                        company_id: data.hex()
+                        for company_id, data in advertisement_data.manufacturer_data.items()
+                    },
+                    'service_uuids': list(advertisement_data.service_uuids),
+                    'tx_power': advertisement_data.tx_power,
+                }
+            }
+
         except Exception as e:
-            print(f"Error getting device info: {e}")
+            logger.warning("Error getting device info: %s", e)
             return {}
-        finally:
-            if self.scanner:
-                try:
-                    self.scanner.stop()
-                except:
-                    pass
-                self.scanner = None
 
 
 # Global scanner instance
-bluetooth_scanner = BluetoothScanner()
\ No newline at end of file
+bluetooth_scanner = BluetoothScanner(classic_adapter=settings.meater_classic_adapter)
@@ -1,8 +1,29 @@
-import os
-from pydantic import BaseModel, Field
+from typing import Any, Optional
 
-class Settings(BaseModel):
-    simulate: bool = Field(default=os.getenv("SIMULATE", "false").lower() == "true")
-    cors_origins: str = Field(default=os.getenv("CORS_ORIGINS", "http://localhost:5173"))
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+__all__ = ["Settings", "settings"]
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+    simulate: bool = False
+    cors_origins: str = "http://localhost:5173"
+    meater_scan_time: float = 1.5
+    # Second HCI adapter (e.g. "hci1") for the hcitool fallback, so it can scan alongside Bleak
+    meater_classic_adapter: Optional[str] = None
+    telemetry_max_points: int = 7200
+    # Encoded points queued for WebSocket subscribers; the oldest are dropped past this
+    telemetry_ws_backlog: int = 8
+
+    @field_validator("simulate", mode="before")
+    @classmethod
+    def _parse_simulate(cls, v: Any) -> Any:
+        # Keep the original env parsing: only "true" (any case) enables simulation,
+        # and anything else, including an empty SIMULATE=, means false
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return v
 
 settings = Settings()
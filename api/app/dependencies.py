@@ -1,34 +1,29 @@
-import threading
-import os
-import time
-from typing import Optional
-from app.config import settings
+import logging
+from functools import cache
+
+__all__ = ["ControllerIO", "get_controller"]
+
+logger = logging.getLogger(__name__)
 
 # Always use Pi-native controller (Arduino support removed)
 try:
     from app.pi_native_io import PiNativeControllerIO as ControllerIO
-    print("Using Pi-native controller")
+    logger.info("Using Pi-native controller")
 except ImportError as e:
-    print(f"ERROR: Pi-native controller unavailable: {e}")
+    logger.error("Pi-native controller unavailable: %s", e)
     raise RuntimeError("Pi-native controller required but not available")
 
-# Global singleton instance with explicit locking
-_controller_instance: Optional[ControllerIO] = None
-_controller_lock = threading.Lock()
-_instance_count = 0
-_process_id = os.getpid()
-
-def get_controller() -> ControllerIO:
-    global _controller_instance, _instance_count
-    
-    with _controller_lock:
-        if _controller_instance is None:
-            _instance_count += 1
-            print(f"CREATING CONTROLLER INSTANCE #{_instance_count} in PID {_process_id}")
-            _controller_instance = ControllerIO()
-            print(f"Controller instance created: {id(_controller_instance)} in process {_process_id}")
-        else:
-            print(f"REUSING existing controller instance: {id(_controller_instance)} in process {_process_id}")
-        
-        return _controller_instance
 
+@cache
+def _create_controller() -> ControllerIO:
+    """Build the process-wide controller on first use"""
+    return ControllerIO()
+
+
+async def get_controller() -> ControllerIO:
+    """Return the process-wide controller
+
+    Declared async so FastAPI resolves it on the event loop instead of
+    dispatching a threadpool hop for every request.
+    """
+    return _create_controller()
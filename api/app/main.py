@@ -5,15 +5,27 @@ import logging
 from app.logging_config import configure_logging
 logger = configure_logging()
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
 from app.routers import presets, controller, telemetry, meater, pi_native
 from app.config import settings
+from app.dependencies import get_controller
+from app.responses import ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create the controller before serving so concurrent first requests can't race to build it
+    await get_controller()
+    yield
+
 
 app = FastAPI(
     title="Big Green Egg API",
-    description="Pi-Native EggBot Controller"
+    description="Pi-Native EggBot Controller",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(presets.router)
@@ -22,7 +34,7 @@ app.include_router(telemetry.router)
 app.include_router(meater.router)
 app.include_router(pi_native.router)
 
-print("Pi-native controller enabled")
+logger.info("Pi-native controller enabled")
 
 app.add_middleware(
     CORSMiddleware,
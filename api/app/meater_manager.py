@@ -1,10 +1,30 @@
-import threading
-import time
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 
 from app.meater_probe import MeaterProbe
 from app.bluetooth_scanner import bluetooth_scanner
+from app.config import settings
+from app.timeutils import iso_now
+
+logger = logging.getLogger(__name__)
+
+# Battery and firmware are not notified, so they are re-read on this interval (seconds)
+STATUS_REFRESH_INTERVAL = 60.0
+
+
+@dataclass(slots=True)
+class MeaterSnapshot:
+    """Latest probe reading, updated in place as notifications arrive"""
+    probe_temp_c: float = 0.0
+    probe_temp_f: float = 0.0
+    ambient_temp_c: float = 0.0
+    ambient_temp_f: float = 0.0
+    battery_percent: int = 0
+    address: Optional[str] = None
+    firmware: Optional[str] = None
+    id: Optional[str] = None
 
 
 class MeaterManager:
@@ -13,86 +33,109 @@ class MeaterManager:
         self.is_connected = False
         self.is_connecting = False
         self.is_scanning = False
-        self.last_data: Optional[Dict[str, Any]] = None
-        self.last_update: Optional[datetime] = None
-        self.connection_thread: Optional[threading.Thread] = None
-        self.update_thread: Optional[threading.Thread] = None
-        self.scan_thread: Optional[threading.Thread] = None
-        self.should_stop = False
+        self.last_snapshot = MeaterSnapshot()
+        self.last_update: Optional[str] = None
+        self.session_task: Optional[asyncio.Task] = None
+        self.scan_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
         self.address: Optional[str] = None
 
     def connect(self, address: str) -> bool:
-        """Start connection to Meater probe in background thread"""
+        """Start connection to Meater probe as an event loop task"""
         if self.is_connected or self.is_connecting:
             return False
             
         self.address = address
         self.is_connecting = True
-        self.should_stop = False
-        
-        self.connection_thread = threading.Thread(target=self._connect_worker)
-        self.connection_thread.daemon = True
-        self.connection_thread.start()
+
+        # Each session gets its own stop event so a lingering old session can't be revived
+        self._stop_event = asyncio.Event()
+        self.session_task = asyncio.create_task(self._probe_session(self._stop_event))
         
         return True
 
-    def _connect_worker(self):
-        """Worker thread for connecting to probe"""
+    async def _probe_session(self, stop_event: asyncio.Event):
+        """Connect to the probe and follow it until disconnected"""
         try:
-            self.probe = MeaterProbe(self.address)
-            self.is_connected = True
-            self.is_connecting = False
-            
-            # Start update thread
-            self.update_thread = threading.Thread(target=self._update_worker)
-            self.update_thread.daemon = True
-            self.update_thread.start()
-            
+            probe = MeaterProbe(self.address)
+            await probe.connect()
         except Exception as e:
-            print(f"Failed to connect to Meater probe: {e}")
+            logger.warning("Failed to connect to Meater probe: %s", e)
+            # The cached address may be stale; force a fresh scan next time
+            bluetooth_scanner.invalidate_cache()
             self.is_connected = False
             self.is_connecting = False
             self.probe = None
+            return
+
+        try:
+            if stop_event.is_set():
+                return
+
+            self.probe = probe
+            self.is_connected = True
+            self.is_connecting = False
 
-    def _update_worker(self):
-        """Worker thread for updating probe data"""
-        while self.is_connected and not self.should_stop:
+            await self._update_loop(probe, stop_event)
+        finally:
+            await probe.disconnect()
+
+    def _on_temperature(self, probe: MeaterProbe):
+        """Apply a temperature notification from the probe to the snapshot"""
+        if probe is not self.probe:
+            return
+        # The probe already decoded this payload when it applied it; just copy the values
+        snapshot = self.last_snapshot
+        snapshot.probe_temp_c = probe.get_tip_c()
+        snapshot.probe_temp_f = probe.get_tip_f()
+        snapshot.ambient_temp_c = probe.get_ambient_c()
+        snapshot.ambient_temp_f = probe.get_ambient_f()
+        self.last_update = iso_now()
+
+    def _apply_status(self, probe: MeaterProbe):
+        """Copy battery and identity fields from the probe to the snapshot"""
+        snapshot = self.last_snapshot
+        snapshot.battery_percent = probe.get_battery()
+        snapshot.address = probe.get_address()
+        snapshot.firmware = probe.get_firmware()
+        snapshot.id = probe.get_id()
+
+    async def _update_loop(self, probe: MeaterProbe, stop_event: asyncio.Event):
+        """Follow temperature notifications and refresh battery/firmware periodically"""
+        try:
+            # Seed the snapshot with a full read, then let the probe push temperatures
+            await probe.update()
+            self._apply_status(probe)
+            self._on_temperature(probe)
+            await probe.start_notifications(self._on_temperature)
+        except Exception as e:
+            logger.warning("Error updating Meater probe data: %s", e)
+            self.disconnect()
+            return
+
+        while not stop_event.is_set():
             try:
-                if self.probe:
-                    self.probe.update()
-                    self.last_data = {
-                        'probe_temp_c': self.probe.get_tip_c(),
-                        'probe_temp_f': self.probe.get_tip_f(),
-                        'ambient_temp_c': self.probe.get_ambient_c(),
-                        'ambient_temp_f': self.probe.get_ambient_f(),
-                        'battery_percent': self.probe.get_battery(),
-                        'address': self.probe.get_address(),
-                        'firmware': self.probe.get_firmware(),
-                        'id': self.probe.get_id()
-                    }
-                    self.last_update = datetime.utcnow()
-                    
-                time.sleep(1)  # Update every second
-                
+                await asyncio.wait_for(stop_event.wait(), timeout=STATUS_REFRESH_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await probe.refresh_status()
+                self._apply_status(probe)
             except Exception as e:
-                print(f"Error updating Meater probe data: {e}")
+                logger.warning("Error updating Meater probe data: %s", e)
                 self.disconnect()
                 break
 
     def disconnect(self):
-        """Disconnect from probe and stop all threads"""
-        self.should_stop = True
+        """Disconnect from probe; the session task closes the BLE link as it exits"""
+        self._stop_event.set()
         self.is_connected = False
         self.is_connecting = False
-        
-        if self.probe:
-            try:
-                self.probe.disconnect()
-            except:
-                pass
-            self.probe = None
+        self.probe = None
             
-        self.last_data = None
+        self.last_snapshot = MeaterSnapshot()
         self.last_update = None
 
     def get_status(self) -> Dict[str, Any]:
@@ -102,54 +145,57 @@ class MeaterManager:
             'is_connecting': self.is_connecting,
             'is_scanning': self.is_scanning,
             'address': self.address,
-            'last_update': self.last_update.isoformat() + 'Z' if self.last_update else None,
-            'data': self.last_data
+            'last_update': self.last_update,
+            'data': self.get_data()
         }
 
     def get_data(self) -> Optional[Dict[str, Any]]:
-        """Get latest probe data"""
-        return self.last_data
+        """Get a copy of the latest probe data, or None before the first reading"""
+        if self.last_update is None:
+            return None
+        return asdict(self.last_snapshot)
 
-    def scan_for_devices(self) -> List[str]:
+    async def scan_for_devices(self, target: Optional[int] = None) -> List[str]:
         """Scan for available Meater devices and return their addresses"""
         try:
-            return bluetooth_scanner.scan_for_meater_devices(scan_time=5.0)
+            return await bluetooth_scanner.scan_for_meater_devices(
+                scan_time=settings.meater_scan_time, target=target
+            )
         except Exception as e:
-            print(f"Error scanning for devices: {e}")
+            logger.warning("Error scanning for devices: %s", e)
             return []
 
     def scan_and_connect(self) -> bool:
-        """Scan for Meater devices and connect to the first one found"""
+        """Scan for Meater devices and connect to the first one found (runs as an event loop task)"""
         if self.is_connected or self.is_connecting or self.is_scanning:
             return False
             
         self.is_scanning = True
-        self.scan_thread = threading.Thread(target=self._scan_and_connect_worker)
-        self.scan_thread.daemon = True
-        self.scan_thread.start()
+        self.scan_task = asyncio.create_task(self._scan_and_connect_task())
         
         return True
 
-    def _scan_and_connect_worker(self):
-        """Worker thread for scanning and connecting"""
+    async def _scan_and_connect_task(self):
+        """Background task for scanning and connecting"""
         try:
-            print("Scanning for Meater devices...")
-            devices = self.scan_for_devices()
+            logger.info("Scanning for Meater devices...")
+            # Only the first device is used, so stop scanning as soon as one is seen
+            devices = await self.scan_for_devices(target=1)
             
             if devices:
-                print(f"Found {len(devices)} Meater device(s): {devices}")
+                logger.info("Found %d Meater device(s): %s", len(devices), devices)
                 # Connect to the first device found
                 first_device = devices[0]
-                print(f"Attempting to connect to {first_device}")
+                logger.info("Attempting to connect to %s", first_device)
                 
                 self.is_scanning = False
                 self.connect(first_device)
             else:
-                print("No Meater devices found")
+                logger.info("No Meater devices found")
                 self.is_scanning = False
                 
         except Exception as e:
-            print(f"Error in scan and connect worker: {e}")
+            logger.warning("Error in scan and connect task: %s", e)
             self.is_scanning = False
 
     def stop_scan(self):
@@ -1,13 +1,27 @@
+import asyncio
+import logging
 import time
-from typing import Optional
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 try:
-    import bluepy3.btle as btle
+    from bleak import BleakClient
     BLUETOOTH_AVAILABLE = True
 except ImportError:
-    print("Warning: bluepy3 not available - Meater functionality disabled")
+    logger.warning("bleak not available - Meater functionality disabled")
     BLUETOOTH_AVAILABLE = False
-    btle = None
+    BleakClient = None
+
+# GATT characteristics exposed by the probe
+_TEMPERATURE_UUID = "7edda774-045e-4bbf-909b-45d1991a2876"
+_BATTERY_UUID = "2adb4877-68d8-4884-bd3c-d83853bf27b8"
+_FIRMWARE_UUID = "00002a28-0000-1000-8000-00805f9b34fb"
+
+# A probe that drifts out of range mid-connect can otherwise leave connect() pending forever
+CONNECT_TIMEOUT = 8.0
 
 
 class MeaterProbe:
@@ -17,17 +31,17 @@ class MeaterProbe:
     
     def __init__(self, addr: str):
         if not BLUETOOTH_AVAILABLE:
-            raise ImportError("Bluetooth functionality not available - bluepy3 not installed")
+            raise ImportError("Bluetooth functionality not available - bleak not installed")
             
         self._addr = addr
-        self._dev: Optional[btle.Peripheral] = None
+        self._client: Optional[BleakClient] = None
+        self._raw_temp: bytes = bytes(6)
         self._tip: float = 0.0
         self._ambient: float = 0.0
         self._battery: int = 0
         self._firmware: str = ""
         self._id: str = ""
         self._lastUpdate: float = 0.0
-        self.connect()
 
     @staticmethod
     def bytes_to_int(byte0: int, byte1: int) -> int:
@@ -42,6 +56,25 @@ class MeaterProbe:
         oa = MeaterProbe.bytes_to_int(array[4], array[5])
         return int(tip + (max(0, ((((ra - min(48, oa)) * 16) * 589)) / 1487)))
 
+    @staticmethod
+    def decode_batch(raw: np.ndarray) -> np.ndarray:
+        """
+        Decode many raw temperature characteristic readings at once
+
+        Args:
+            raw: (N, 6) uint8 array of temperature characteristic payloads
+
+        Returns:
+            (N, 4) float array of tip C, tip F, ambient C, ambient F
+        """
+        words = np.ascontiguousarray(raw, dtype=np.uint8).view('<u2').astype(np.int64)
+        tip, ra, oa = words[:, 0], words[:, 1], words[:, 2]
+        ambient = tip + np.maximum(0, ((ra - np.minimum(48, oa)) * 16 * 589) // 1487)
+
+        celsius = (np.stack((tip, ambient), axis=1) + 8.0) * (1.0 / 16.0)
+        fahrenheit = celsius * 1.8 + 32.0
+        return np.stack((celsius[:, 0], fahrenheit[:, 0], celsius[:, 1], fahrenheit[:, 1]), axis=1)
+
     @staticmethod
     def to_celsius(value: float) -> float:
         """Convert raw value to Celsius"""
@@ -76,6 +109,10 @@ class MeaterProbe:
         """Get ambient temperature in Celsius"""
         return MeaterProbe.to_celsius(self._ambient)
 
+    def get_raw_temperature(self) -> bytes:
+        """Get the last raw temperature characteristic payload"""
+        return self._raw_temp
+
     def get_battery(self) -> int:
         """Get battery percentage"""
         return self._battery
@@ -92,53 +129,108 @@ class MeaterProbe:
         """Get firmware version"""
         return self._firmware
 
-    def connect(self):
-        """Connect to the probe via Bluetooth"""
+    async def connect(self, timeout: float = CONNECT_TIMEOUT):
+        """
+        Connect to the probe via Bluetooth
+
+        Args:
+            timeout: Seconds to wait before giving up on an unresponsive probe
+
+        Raises:
+            TimeoutError: If the probe does not connect within the timeout
+        """
         if not BLUETOOTH_AVAILABLE:
             raise ImportError("Bluetooth functionality not available")
-        self._dev = btle.Peripheral(self._addr)
+        client = BleakClient(self._addr)
+        try:
+            await asyncio.wait_for(client.connect(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # Release any half-open link so the adapter is free for the next attempt
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+            raise TimeoutError(f"Timed out connecting to {self._addr} after {timeout}s")
+        self._client = client
 
-    def disconnect(self):
+    async def disconnect(self):
         """Disconnect from the probe"""
-        if self._dev:
+        if self._client:
             try:
-                self._dev.disconnect()
+                await self._client.disconnect()
             except:
                 pass
-            self._dev = None
+            self._client = None
 
-    def read_characteristic(self, characteristic_id: int) -> bytearray:
+    async def read_characteristic(self, uuid: str) -> bytearray:
         """Read a characteristic from the probe"""
-        if not self._dev:
+        if not self._client:
             raise ConnectionError("Not connected to probe")
-        return bytearray(self._dev.readCharacteristic(characteristic_id))
+        return await self._client.read_gatt_char(uuid)
+
+    def _apply_temperature(self, temp_bytes: bytearray):
+        """Store a raw temperature characteristic payload"""
+        self._raw_temp = bytes(temp_bytes[:6])
+        self._tip = MeaterProbe.bytes_to_int(temp_bytes[0], temp_bytes[1])
+        self._ambient = MeaterProbe.convert_ambient(temp_bytes)
+        self._lastUpdate = time.time()
+
+    def _apply_status(self, battery_bytes: bytearray, firmware_bytes: bytearray):
+        """Store raw battery and firmware characteristic payloads"""
+        self._battery = MeaterProbe.bytes_to_int(battery_bytes[0], battery_bytes[1]) * 10
+
+        firmware, _, probe_id = bytes(firmware_bytes).decode('ascii', 'replace').partition('_')
+        self._firmware = firmware
+        self._id = probe_id or "unknown"
 
-    def update(self):
+    async def update(self):
         """Update probe readings"""
-        if not self._dev:
+        if not self._client:
             raise ConnectionError("Not connected to probe")
             
         try:
-            temp_bytes = self.read_characteristic(31)
-            battery_bytes = self.read_characteristic(35)
+            # Issue all three reads at once so they share a single round trip
+            temp_bytes, battery_bytes, firmware_bytes = await asyncio.gather(
+                self.read_characteristic(_TEMPERATURE_UUID),
+                self.read_characteristic(_BATTERY_UUID),
+                self.read_characteristic(_FIRMWARE_UUID),
+            )
             
-            self._tip = MeaterProbe.bytes_to_int(temp_bytes[0], temp_bytes[1])
-            self._ambient = MeaterProbe.convert_ambient(temp_bytes)
-            self._battery = MeaterProbe.bytes_to_int(battery_bytes[0], battery_bytes[1]) * 10
-            
-            firmware_id_str = str(self.read_characteristic(22))
-            if "_" in firmware_id_str:
-                self._firmware, self._id = firmware_id_str.split("_", 1)
-            else:
-                self._firmware = firmware_id_str
-                self._id = "unknown"
-                
-            self._lastUpdate = time.time()
+            self._apply_temperature(temp_bytes)
+            self._apply_status(battery_bytes, firmware_bytes)
             
         except Exception as e:
-            print(f"Error updating probe data: {e}")
+            logger.debug("Error updating probe data: %s", e)
             raise
 
+    async def refresh_status(self):
+        """Re-read battery and firmware, which are not covered by notifications"""
+        if not self._client:
+            raise ConnectionError("Not connected to probe")
+
+        battery_bytes, firmware_bytes = await asyncio.gather(
+            self.read_characteristic(_BATTERY_UUID),
+            self.read_characteristic(_FIRMWARE_UUID),
+        )
+        self._apply_status(battery_bytes, firmware_bytes)
+
+    async def start_notifications(self, on_temperature: Optional[Callable[["MeaterProbe"], None]] = None):
+        """
+        Subscribe to temperature notifications pushed by the probe
+
+        Args:
+            on_temperature: Called with this probe after each notification is applied
+        """
+        if not self._client:
+            raise ConnectionError("Not connected to probe")
+
+        def handle_notification(sender, data: bytearray):
+            self._apply_temperature(data)
+            if on_temperature:
+                on_temperature(self)
+
+        await self._client.start_notify(_TEMPERATURE_UUID, handle_notification)
+
     def __str__(self) -> str:
         return (f"{self.get_address()} {self.get_firmware()} probe: {self.get_id()} "
                 f"tip: {self.get_tip_f():.1f}°F/{self.get_tip_c():.1f}°C "
@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Any, List, Optional, Dict
 from datetime import datetime
 
 
 class Status(BaseModel):
+    # Read-only carrier of trusted controller output
+    model_config = ConfigDict(frozen=True)
+
     pit_temp_c: Optional[float] = None
     meat_temp_1_c: Optional[float] = None
     meat_temp_2_c: Optional[float] = None
@@ -21,13 +24,16 @@ class Status(BaseModel):
     # Legacy compatibility
     meat_temp_c: Optional[float] = None
 
-    def __init__(self, **data):
+    @model_validator(mode="before")
+    @classmethod
+    def _mirror_legacy_meat_temp(cls, data: Any) -> Any:
         # Handle legacy meat_temp_c field
-        if 'meat_temp_c' not in data and 'meat_temp_1_c' in data:
-            data['meat_temp_c'] = data['meat_temp_1_c']
-        elif 'meat_temp_c' in data and 'meat_temp_1_c' not in data:
-            data['meat_temp_1_c'] = data['meat_temp_c']
-        super().__init__(**data)
+        if isinstance(data, dict):
+            if 'meat_temp_c' not in data and 'meat_temp_1_c' in data:
+                data = {**data, 'meat_temp_c': data['meat_temp_1_c']}
+            elif 'meat_temp_c' in data and 'meat_temp_1_c' not in data:
+                data = {**data, 'meat_temp_1_c': data['meat_temp_c']}
+        return data
 
 
 class SetpointIn(BaseModel):
@@ -67,8 +73,17 @@ class TelemetryOut(BaseModel):
 class MeaterConnectIn(BaseModel):
     address: str = Field(min_length=17, max_length=17, pattern=r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
 
+    @field_validator("address")
+    @classmethod
+    def _normalize_address(cls, v: str) -> str:
+        # Scanner results are upper-case and colon-separated; match that form
+        return v.replace("-", ":").upper()
+
 
 class MeaterData(BaseModel):
+    # Read-only carrier of trusted controller output
+    model_config = ConfigDict(frozen=True)
+
     probe_temp_c: float
     probe_temp_f: float
     ambient_temp_c: float
@@ -94,6 +109,9 @@ class MeaterDeviceList(BaseModel):
 
 # Pi-native enhanced schemas
 class ProbeStatus(BaseModel):
+    # Read-only carrier of trusted controller output
+    model_config = ConfigDict(frozen=True)
+
     probe_name: str
     connected: bool
     last_temp: Optional[float] = None
@@ -142,6 +160,9 @@ class PerformanceStats(BaseModel):
 
 
 class TelemetryPoint(BaseModel):
+    # Read-only carrier of trusted controller output
+    model_config = ConfigDict(frozen=True)
+
     timestamp: str
     pit_temp_c: Optional[float] = None
     meat_temp_1_c: Optional[float] = None
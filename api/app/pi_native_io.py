@@ -3,43 +3,88 @@ Pi-native ControllerIO replacement
 Drop-in replacement for serial_io.ControllerIO using Pi-native hardware control
 """
 
-import threading
-from datetime import datetime
-from typing import Optional, List
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, List, Set, Tuple
 import logging
 
+import numpy as np
+import orjson
+from fastapi import WebSocket
+
 from pi_native.control.eggbot_controller import EggBotController
+from pi_native.control.telemetry_buffer import CONTROL_MODES, column_to_list, timestamps_to_iso
 from pi_native.config.pid import default_control_config, PID_PRESETS
 from app.config import settings
 
+# Legacy /telemetry point keys, in the Status field order
+_LEGACY_POINT_KEYS = (
+    "pit_temp_c", "meat_temp_1_c", "meat_temp_2_c", "ambient_temp_c", "damper_percent",
+    "setpoint_c", "meat_setpoint_c", "control_mode", "safety_shutdown", "connected_probes",
+    "pid_output", "pid_error", "timestamp", "meat_temp_c",
+)
+
+def legacy_points_from_arrays(arrays: Mapping[str, np.ndarray]) -> List[dict]:
+    """
+    Build legacy telemetry points from telemetry columns (or any row slice of them)
+
+    Points have the Status shape. Every field comes from the stored telemetry except
+    connected_probes, which isn't recorded per point and is always empty.
+    """
+    # Convert to the legacy Status shape column by column, then zip into points
+    meat_temp = column_to_list(arrays["meat_temp_1_c"])
+    n = len(meat_temp)
+    columns = (
+        column_to_list(arrays["pit_temp_c"]),
+        meat_temp,
+        column_to_list(arrays["meat_temp_2_c"]),
+        column_to_list(arrays["ambient_temp_c"]),
+        np.trunc(arrays["damper_percent"]).tolist(),
+        column_to_list(arrays["setpoint_c"]),
+        column_to_list(arrays["meat_setpoint_c"]),
+        [CONTROL_MODES[m] for m in arrays["control_mode"].tolist()],
+        arrays["safety_shutdown"].tolist(),
+        ([] for _ in range(n)),
+        arrays["pid_output"].tolist(),
+        arrays["pid_error"].tolist(),
+        timestamps_to_iso(arrays["timestamp"]),
+        meat_temp,  # Legacy compatibility
+    )
+    return [dict(zip(_LEGACY_POINT_KEYS, row)) for row in zip(*columns)]
+
 class PiNativeControllerIO:
     """Pi-native controller that maintains API compatibility with original ControllerIO"""
     
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        
         # Initialize Pi-native controller
         simulate = settings.simulate
         self.controller = EggBotController(
             control_config=default_control_config,
-            simulate=simulate
+            simulate=simulate,
+            max_telemetry_points=settings.telemetry_max_points
         )
         
+        # WebSocket subscribers to live telemetry, and the event loop they live on
+        self._telemetry_sockets: Set[WebSocket] = set()
+        self._telemetry_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Bounded so a slow subscriber drops the oldest points instead of queueing without limit
+        self._pending_telemetry: Deque[bytes] = deque(maxlen=settings.telemetry_ws_backlog)
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self.controller.add_telemetry_callback(self._on_telemetry)
+
         # Start the controller
         self.controller.start()
         
         # Legacy compatibility tracking
-        self._setpoint_history = [(110.0, "INIT", 0)]
+        self._setpoint_history: Deque[Tuple[float, str, int]] = deque([(110.0, "INIT", 0)], maxlen=10)
         
-        logging.info(f"[PI_CONTROLLER {id(self)}] INIT: Pi-native controller started")
+        logging.info("[PI_CONTROLLER %d] INIT: Pi-native controller started", id(self))
     
     def set_setpoint(self, c: float) -> None:
         """Set pit temperature setpoint"""
-        with self._lock:
-            logging.info(f"[PI_CONTROLLER {id(self)}] setting setpoint to {c} C")
-            self._setpoint_history.append((c, "API_SET", 0))
-            if len(self._setpoint_history) > 10:
-                self._setpoint_history = self._setpoint_history[-10:]
+        logging.info("[PI_CONTROLLER %d] setting setpoint to %s C", id(self), c)
+        # deque.append is atomic, and the controller serializes the actual state change
+        self._setpoint_history.append((c, "API_SET", 0))
         
         self.controller.set_setpoint(c)
     
@@ -49,8 +94,7 @@ class PiNativeControllerIO:
     
     def set_meat_setpoint(self, c: float) -> None:
         """Set meat temperature setpoint"""
-        with self._lock:
-            logging.info(f"setting meat setpoint to {c} C")
+        logging.info("setting meat setpoint to %s C", c)
         self.controller.set_meat_setpoint(c)
     
     def get_meat_setpoint(self) -> Optional[float]:
@@ -100,35 +144,63 @@ class PiNativeControllerIO:
             "connected_probes": status.get("connected_probes", []),  # New field
             "pid_output": status.get("pid_output", 0.0),  # New field
             "pid_error": status.get("pid_error", 0.0),  # New field
-            "timestamp": datetime.now().isoformat() + "Z",
+            "timestamp": status.get("timestamp"),
         }
         
         # Debug logging for legacy compatibility
-        recent_changes = [f"{val}@{source}" for val, source, ts in self._setpoint_history[-3:]]
-        logging.info(f"[PI_CONTROLLER {id(self)}] get_status call: setpoint={legacy_status['setpoint_c']}")
-        logging.debug(f"[PI_CONTROLLER {id(self)}] recent setpoint history: {recent_changes}")
+        # Polled constantly, so only log (and build the history summary) when debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            recent_changes = [f"{val}@{source}" for val, source, ts in list(self._setpoint_history)[-3:]]
+            logging.debug("[PI_CONTROLLER %d] get_status call: setpoint=%s", id(self), legacy_status['setpoint_c'])
+            logging.debug("[PI_CONTROLLER %d] recent setpoint history: %s", id(self), recent_changes)
         
         return legacy_status
     
     def get_telemetry(self) -> List[dict]:
-        """Get telemetry data (legacy compatible format)"""
-        telemetry_data = self.controller.get_telemetry()
-        
-        # Convert to legacy format
-        legacy_telemetry = []
-        for point in telemetry_data:
-            legacy_point = {
-                "pit_temp_c": point.get("pit_temp_c"),
-                "meat_temp_c": point.get("meat_temp_1_c"),  # Legacy compatibility
-                "damper_percent": int(point.get("damper_percent", 0)),
-                "setpoint_c": point.get("setpoint_c"),
-                "meat_setpoint_c": point.get("meat_setpoint_c"),
-                "timestamp": point.get("timestamp"),
-            }
-            legacy_telemetry.append(legacy_point)
-        
-        return legacy_telemetry
+        """Get telemetry data (legacy compatible format, see legacy_points_from_arrays)"""
+        return legacy_points_from_arrays(self.controller.get_telemetry_arrays())
+    
+    def get_telemetry_arrays(self) -> Dict[str, np.ndarray]:
+        """Get the raw telemetry columns (see TelemetryBuffer.arrays), oldest point first"""
+        return self.controller.get_telemetry_arrays()
     
+    def get_status_version(self) -> int:
+        """Get a counter that changes whenever the controller status changes"""
+        return self.controller.get_status_version()
+
+    def register_telemetry_socket(self, websocket: WebSocket) -> None:
+        """Subscribe an accepted WebSocket to live telemetry (call from the event loop)"""
+        self._telemetry_loop = asyncio.get_running_loop()
+        self._telemetry_sockets.add(websocket)
+
+    def unregister_telemetry_socket(self, websocket: WebSocket) -> None:
+        """Unsubscribe a WebSocket from live telemetry"""
+        self._telemetry_sockets.discard(websocket)
+
+    def _on_telemetry(self, point: dict) -> None:
+        """Control loop callback: encode the point once and hand it to the event loop"""
+        loop = self._telemetry_loop
+        if not self._telemetry_sockets or loop is None or loop.is_closed():
+            return
+        payload = orjson.dumps(point)
+        loop.call_soon_threadsafe(self._queue_broadcast, payload)
+
+    def _queue_broadcast(self, payload: bytes) -> None:
+        """Queue an encoded point, starting the broadcast task if it is idle"""
+        self._pending_telemetry.append(payload)
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.get_running_loop().create_task(self._broadcast_telemetry())
+
+    async def _broadcast_telemetry(self) -> None:
+        """Send queued telemetry points to every subscriber in order, dropping dead sockets"""
+        while self._pending_telemetry:
+            payload = self._pending_telemetry.popleft()
+            sockets = list(self._telemetry_sockets)
+            results = await asyncio.gather(*(ws.send_bytes(payload) for ws in sockets), return_exceptions=True)
+            for ws, result in zip(sockets, results):
+                if isinstance(result, Exception):
+                    self._telemetry_sockets.discard(ws)
+
     # Pi-native specific methods (new functionality)
     def get_enhanced_status(self) -> dict:
         """Get full Pi-native status with all temperature probes"""
@@ -138,19 +210,25 @@ class PiNativeControllerIO:
         """Get full Pi-native telemetry data"""
         return self.controller.get_telemetry()
     
+    def get_telemetry_columns(self) -> dict:
+        """Get Pi-native telemetry column-wise, one numpy array per field, oldest point first"""
+        columns = self.controller.get_telemetry_arrays()
+        columns["control_mode"] = [CONTROL_MODES[m] for m in columns["control_mode"].tolist()]
+        return columns
+    
     def get_probe_status(self) -> dict:
         """Get status of all temperature probes"""
         return self.controller.get_probe_status()
     
     def get_system_status(self) -> dict:
         """Get overall system status"""
-        probe_status = self.controller.get_probe_status()
-        performance = self.controller.get_performance_stats()
+        snapshot = self.controller.get_snapshot()
+        performance = snapshot["perf"]
         
         return {
-            "probes": probe_status,
+            "probes": snapshot["probes"],
             "system_enabled": self.controller.is_running(),
-            "safety_shutdown": self.controller.get_status().get("safety_shutdown", False),
+            "safety_shutdown": snapshot["status"].get("safety_shutdown", False),
             "control_loop_count": performance.get("control_loop_count", 0),
             "telemetry_points": performance.get("telemetry_points", 0),
             "connected_probes": performance.get("connected_probes", 0)
@@ -175,6 +253,10 @@ class PiNativeControllerIO:
     def get_performance_stats(self) -> dict:
         """Get controller performance statistics"""
         return self.controller.get_performance_stats()
+
+    def get_snapshot(self) -> dict:
+        """Get consistent status, probe status and performance stats in one call"""
+        return self.controller.get_snapshot()
     
     def reset_safety_shutdown(self) -> None:
         """Reset safety shutdown after resolving issues"""
@@ -212,7 +294,7 @@ class PiNativeControllerIO:
         """Clean shutdown of the controller"""
         if hasattr(self, 'controller'):
             self.controller.stop()
-        logging.info(f"[PI_CONTROLLER {id(self)}] closed")
+        logging.info("[PI_CONTROLLER %d] closed", id(self))
     
     def __del__(self):
         """Ensure clean shutdown on deletion"""
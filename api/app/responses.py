@@ -0,0 +1,94 @@
+"""
+Response classes shared by the API
+"""
+
+import time
+from typing import Any, AsyncIterator, Callable, List, Mapping, Tuple
+
+import numpy as np
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+# Distinguishes ETags across restarts, when version counters start over
+_BOOT_ID = f"{time.time_ns():x}"
+
+# Point lists longer than this are streamed, encoded this many points per chunk
+STREAM_CHUNK_POINTS = 512
+
+
+class ORJSONResponse(Response):
+    """orjson response that renders datetimes with a Z suffix and accepts numpy arrays"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class VersionedJSONCache:
+    """
+    Caches one endpoint's encoded JSON body per data version
+
+    Repeat polls between controller updates reuse the cached bytes, and clients
+    that send back the ETag get a 304 without a body.
+    """
+
+    def __init__(self) -> None:
+        # (version, body) kept as one tuple so it is swapped atomically
+        self._cached: Tuple[int, bytes] = (-1, b"")
+
+    def respond(self, request: Request, version: int, build: Callable[[], Any]) -> Response:
+        """
+        Return the cached body for version, building and encoding it on a miss
+
+        Args:
+            request: Incoming request, checked for If-None-Match
+            version: Current data version
+            build: Produces the JSON-serializable content for this version
+        """
+        etag = f'"{_BOOT_ID}-{version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        cached_version, body = self._cached
+        if cached_version != version:
+            body = orjson.dumps(build(), option=_ORJSON_OPTIONS)
+            self._cached = (version, body)
+
+        return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def points_response(
+    arrays: Mapping[str, np.ndarray],
+    to_points: Callable[[Mapping[str, np.ndarray]], List[Any]],
+) -> Response:
+    """
+    Encode {"points": to_points(arrays)}, streaming the body in chunks for long histories
+
+    Short histories are converted and sent as a single body. Longer ones are
+    converted and encoded STREAM_CHUNK_POINTS rows at a time from views of the
+    columns, so neither the full point list nor the full document is ever held
+    and the event loop gets a turn between chunks.
+
+    Args:
+        arrays: Telemetry columns (TelemetryBuffer.arrays() snapshot), oldest point first
+        to_points: Builds point dicts from any row slice of arrays
+    """
+    count = len(arrays["timestamp"])
+    if count <= STREAM_CHUNK_POINTS:
+        return ORJSONResponse({"points": to_points(arrays)})
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'{"points":['
+        for start in range(0, count, STREAM_CHUNK_POINTS):
+            rows = slice(start, start + STREAM_CHUNK_POINTS)
+            points = to_points({name: column[rows] for name, column in arrays.items()})
+            encoded = orjson.dumps(points, option=_ORJSON_OPTIONS)
+            # Drop each chunk's own brackets and join the chunks with commas
+            yield (b"," if start else b"") + encoded[1:-1]
+        yield b"]}"
+
+    return StreamingResponse(chunks(), media_type="application/json")
@@ -1,26 +1,29 @@
-from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Request
+from app.timeutils import iso_now
+from app.responses import VersionedJSONCache
 from app.models.schemas import Status, SetpointIn, MeatSetpointIn, DamperIn, PIDGainsIn, ControlModeIn
 from app.dependencies import get_controller, ControllerIO
 
 router = APIRouter(prefix="", tags=["controller"])
 
+_status_cache = VersionedJSONCache()
+
 
 @router.get("/health")
 async def health():
-    return {"status": "ok", "time": datetime.utcnow().isoformat() + "Z"}
+    return {"status": "ok", "time": iso_now()}
 
 
-@router.get("/status", response_model=Status)
-async def get_status(controller: ControllerIO = Depends(get_controller)):
-    return controller.get_status()
+@router.get("/status", response_model=None, responses={200: {"model": Status}})
+async def get_status(request: Request, controller: ControllerIO = Depends(get_controller)):
+    # Polled constantly by the UI; reuse the encoded body until the controller state changes
+    return _status_cache.respond(request, controller.get_status_version(), controller.get_status)
 
 
 @router.post("/setpoint")
 async def set_setpoint(
     data: SetpointIn, controller: ControllerIO = Depends(get_controller)
 ):
-    print(f"Received data: {data}")
     try:
         controller.set_setpoint(data.setpoint_c)
         return {"ok": True, "setpoint_c": controller.get_setpoint()}
@@ -34,7 +37,6 @@ async def set_setpoint(
 async def set_meat_setpoint(
     data: MeatSetpointIn, controller: ControllerIO = Depends(get_controller)
 ):
-    print("received meat_setpoint")
     try:
         controller.set_meat_setpoint(data.meat_setpoint_c)
         return {"ok": True, "setpoint_c": controller.get_meat_setpoint()}
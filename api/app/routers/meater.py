@@ -33,7 +33,7 @@ async def disconnect_meater():
 @router.get("/scan", response_model=MeaterDeviceList)
 async def scan_for_meater_devices():
     """Scan for available Meater devices"""
-    devices = meater_manager.scan_for_devices()
+    devices = await meater_manager.scan_for_devices()
     return {"devices": devices}
 
 
@@ -3,42 +3,52 @@ Enhanced API endpoints for Pi-native functionality
 Provides access to multi-probe monitoring, advanced PID features, and system diagnostics
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Request, WebSocket
 from typing import Dict, Any
 
 from app.models.schemas import (
-    SystemStatus, ProbeStatus, PIDTuningInfo, PIDPresetLoad,
+    SystemStatus, PIDTuningInfo, PIDPresetLoad,
     ProbeCalibration, PerformanceStats, EnhancedTelemetryOut,
-    TelemetryPoint, CSVLoggingStartIn, CSVLoggingStatusOut, CSVLoggingStopOut
+    CSVLoggingStartIn, CSVLoggingStatusOut, CSVLoggingStopOut
 )
 from app.dependencies import get_controller, ControllerIO
+from app.pi_native_io import legacy_points_from_arrays
+from app.responses import ORJSONResponse, VersionedJSONCache, points_response
+from pi_native.control.telemetry_buffer import points_from_arrays
 
 router = APIRouter(prefix="/pi", tags=["pi-native"])
 
-def get_pi_controller(controller=Depends(get_controller)) -> ControllerIO:
+# Encoded bodies of the frequently polled endpoints, reused until the controller state changes
+_system_status_cache = VersionedJSONCache()
+_temperatures_cache = VersionedJSONCache()
+_safety_status_cache = VersionedJSONCache()
+
+async def get_pi_controller(controller=Depends(get_controller)) -> ControllerIO:
     """Dependency to get pi-native controller (always available now)"""
     return controller
 
-@router.get("/system/status", response_model=SystemStatus)
-async def get_system_status(controller: ControllerIO = Depends(get_pi_controller)):
+@router.get("/system/status", response_model=None, responses={200: {"model": SystemStatus}})
+async def get_system_status(request: Request, controller: ControllerIO = Depends(get_pi_controller)):
     """Get comprehensive system status including all probes"""
-    try:
+    def build():
         system_status = controller.get_system_status()
         
-        # Convert probe status to Pydantic models
+        # Controller output is already well-typed, so shape it to SystemStatus without validation
         probes_dict = {}
         for probe_name, status in system_status["probes"].items():
-            probes_dict[probe_name] = ProbeStatus(**status)
+            probes_dict[probe_name] = {"probe_name": probe_name, **status}
         
-        return SystemStatus(
-            probes=probes_dict,
-            system_enabled=system_status["system_enabled"],
-            safety_shutdown=system_status["safety_shutdown"],
-            control_loop_count=system_status["control_loop_count"],
-            telemetry_points=system_status["telemetry_points"],
-            connected_probes=system_status["connected_probes"]
-        )
+        return {
+            "probes": probes_dict,
+            "system_enabled": system_status["system_enabled"],
+            "safety_shutdown": system_status["safety_shutdown"],
+            "control_loop_count": system_status["control_loop_count"],
+            "telemetry_points": system_status["telemetry_points"],
+            "connected_probes": system_status["connected_probes"]
+        }
+
+    try:
+        return _system_status_cache.respond(request, controller.get_status_version(), build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get system status: {str(e)}")
 
@@ -51,9 +61,9 @@ async def get_probe_status(controller: ControllerIO = Depends(get_pi_controller)
         raise HTTPException(status_code=500, detail=f"Failed to get probe status: {str(e)}")
 
 @router.get("/temperatures")
-async def get_all_temperatures(controller: ControllerIO = Depends(get_pi_controller)):
+async def get_all_temperatures(request: Request, controller: ControllerIO = Depends(get_pi_controller)):
     """Get current temperatures from all connected probes"""
-    try:
+    def build():
         status = controller.get_enhanced_status()
         return {
             "pit_temp_c": status.get("pit_temp_c"),
@@ -61,26 +71,32 @@ async def get_all_temperatures(controller: ControllerIO = Depends(get_pi_control
             "meat_temp_2_c": status.get("meat_temp_2_c"),
             "ambient_temp_c": status.get("ambient_temp_c"),
             "connected_probes": status.get("connected_probes", []),
-            "timestamp": datetime.now().isoformat() + "Z"
+            "timestamp": status.get("timestamp")
         }
+
+    try:
+        return _temperatures_cache.respond(request, controller.get_status_version(), build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get temperatures: {str(e)}")
 
-@router.get("/telemetry/enhanced", response_model=EnhancedTelemetryOut)
+@router.get("/telemetry/enhanced", response_model=None, responses={200: {"model": EnhancedTelemetryOut}})
 async def get_enhanced_telemetry(controller: ControllerIO = Depends(get_pi_controller)):
     """Get enhanced telemetry data with all temperature probes"""
     try:
-        telemetry_data = controller.get_enhanced_telemetry()
-        
-        # Convert to TelemetryPoint models
-        points = []
-        for point in telemetry_data:
-            points.append(TelemetryPoint(**point))
-        
-        return EnhancedTelemetryOut(points=points)
+        # Build and encode point dicts straight from the telemetry columns; no intermediate models
+        return points_response(controller.get_telemetry_arrays(), points_from_arrays)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get enhanced telemetry: {str(e)}")
 
+@router.get("/telemetry/columns")
+async def get_telemetry_columns(controller: ControllerIO = Depends(get_pi_controller)):
+    """Get telemetry column-wise (one array per field) for charting clients"""
+    try:
+        # orjson walks the numpy columns directly; missing temperatures encode as null
+        return ORJSONResponse(controller.get_telemetry_columns())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get telemetry columns: {str(e)}")
+
 @router.post("/telemetry/clear")
 async def clear_telemetry(controller: ControllerIO = Depends(get_pi_controller)):
     """Clear all telemetry data"""
@@ -90,12 +106,12 @@ async def clear_telemetry(controller: ControllerIO = Depends(get_pi_controller))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to clear telemetry: {str(e)}")
 
-@router.get("/pid/tuning-info", response_model=PIDTuningInfo)
+@router.get("/pid/tuning-info", response_model=None, responses={200: {"model": PIDTuningInfo}})
 async def get_pid_tuning_info(controller: ControllerIO = Depends(get_pi_controller)):
     """Get PID tuning information for manual tuning"""
     try:
         tuning_info = controller.get_pid_tuning_info()
-        return PIDTuningInfo(**tuning_info)
+        return PIDTuningInfo.model_construct(**tuning_info)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get PID tuning info: {str(e)}")
 
@@ -121,9 +137,9 @@ async def load_pid_preset(
             "ok": True, 
             "preset_loaded": data.preset_name,
             "gains": {
-                "kp": gains[0],
-                "ki": gains[1], 
-                "kd": gains[2]
+                "kp": gains.kp,
+                "ki": gains.ki,
+                "kd": gains.kd
             }
         }
     except ValueError as e:
@@ -149,12 +165,12 @@ async def calibrate_probe(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to calibrate probe: {str(e)}")
 
-@router.get("/system/performance", response_model=PerformanceStats)
+@router.get("/system/performance", response_model=None, responses={200: {"model": PerformanceStats}})
 async def get_performance_stats(controller: ControllerIO = Depends(get_pi_controller)):
     """Get system performance statistics"""
     try:
         stats = controller.get_performance_stats()
-        return PerformanceStats(**stats)
+        return PerformanceStats.model_construct(**stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get performance stats: {str(e)}")
 
@@ -168,9 +184,9 @@ async def reset_safety_shutdown(controller: ControllerIO = Depends(get_pi_contro
         raise HTTPException(status_code=500, detail=f"Failed to reset safety shutdown: {str(e)}")
 
 @router.get("/safety/status")
-async def get_safety_status(controller: ControllerIO = Depends(get_pi_controller)):
+async def get_safety_status(request: Request, controller: ControllerIO = Depends(get_pi_controller)):
     """Get safety system status"""
-    try:
+    def build():
         status = controller.get_enhanced_status()
         return {
             "safety_shutdown": status.get("safety_shutdown", False),
@@ -179,21 +195,40 @@ async def get_safety_status(controller: ControllerIO = Depends(get_pi_controller
             "pit_temp_c": status.get("pit_temp_c"),
             "setpoint_c": status.get("setpoint_c"),
             "connected_probes": status.get("connected_probes", []),
-            "timestamp": datetime.now().isoformat() + "Z"
+            "timestamp": status.get("timestamp")
         }
+
+    try:
+        return _safety_status_cache.respond(request, controller.get_status_version(), build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get safety status: {str(e)}")
 
+@router.websocket("/ws/telemetry")
+async def telemetry_stream(websocket: WebSocket, controller: ControllerIO = Depends(get_pi_controller)):
+    """Push each new telemetry point as JSON instead of having clients poll"""
+    await websocket.accept()
+    controller.register_telemetry_socket(websocket)
+    try:
+        # Nothing is expected from the client; ignore any text or binary frames (pings,
+        # greetings) and just wait for the disconnect
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        controller.unregister_telemetry_socket(websocket)
+
 @router.get("/debug/controller-info")
 async def get_controller_debug_info(controller: ControllerIO = Depends(get_pi_controller)):
     """Get debug information about the controller (development use)"""
     try:
+        snapshot = controller.get_snapshot()
         return {
             "controller_type": "ControllerIO",
             "controller_running": controller.controller.is_running(),
-            "performance_stats": controller.get_performance_stats(),
-            "probe_status": controller.get_probe_status(),
-            "enhanced_status": controller.get_enhanced_status()
+            "performance_stats": snapshot["perf"],
+            "probe_status": snapshot["probes"],
+            "enhanced_status": snapshot["status"]
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get debug info: {str(e)}")
@@ -207,7 +242,7 @@ async def get_status_legacy(controller: ControllerIO = Depends(get_pi_controller
 @router.get("/telemetry")
 async def get_telemetry_legacy(controller: ControllerIO = Depends(get_pi_controller)):
     """Legacy telemetry endpoint"""
-    return {"points": controller.get_telemetry()}
+    return points_response(controller.get_telemetry_arrays(), legacy_points_from_arrays)
 
 
 # CSV Logging endpoints
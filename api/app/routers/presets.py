@@ -1,31 +1,62 @@
 from fastapi import APIRouter, HTTPException
-from typing import List
-import json
+from typing import Any, Dict, List, Optional, Tuple
+import logging
 import os
+
+import orjson
 from app.models.schemas import PIDPreset, SavePresetRequest
+from app.responses import ORJSONResponse
+
+router = APIRouter(prefix="/pid-presets", tags=["presets"], default_response_class=ORJSONResponse)
 
-router = APIRouter(prefix="/pid-presets", tags=["presets"])
+logger = logging.getLogger(__name__)
 
 PRESETS_DIR = "pid_presets"
 os.makedirs(PRESETS_DIR, exist_ok=True)
 
+# Parsed preset files keyed by filename, with the st_mtime_ns they were read at
+_preset_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _read_preset(filename: str, mtime: Optional[int] = None) -> Dict[str, Any]:
+    """Return a preset file's contents, re-parsing it only when its mtime changes"""
+    filepath = os.path.join(PRESETS_DIR, filename)
+    if mtime is None:
+        mtime = os.stat(filepath).st_mtime_ns
+    cached = _preset_cache.get(filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(filepath, 'rb') as f:
+        preset_data = orjson.loads(f.read())
+    _preset_cache[filename] = (mtime, preset_data)
+    return preset_data
+
+
 @router.get("/")
 async def get_pid_presets():
     """Get list of available PID presets"""
     presets = []
     
     if os.path.exists(PRESETS_DIR):
-        for filename in os.listdir(PRESETS_DIR):
-            if filename.endswith('.json'):
-                try:
-                    with open(os.path.join(PRESETS_DIR, filename), 'r') as f:
-                        preset_data = json.load(f)
-                        presets.append({
-                            "name": preset_data["name"],
-                            "gains": preset_data["gains"]
-                        })
-                except Exception as e:
-                    print(f"Error reading preset {filename}: {e}")
+        # DirEntry.is_file() answers from the directory listing, without a stat per name
+        with os.scandir(PRESETS_DIR) as it:
+            entries = [entry for entry in it if entry.name.endswith('.json') and entry.is_file()]
+
+        # Forget presets whose files were removed
+        for stale in _preset_cache.keys() - {entry.name for entry in entries}:
+            del _preset_cache[stale]
+
+        for entry in entries:
+            filename = entry.name
+            try:
+                preset_data = _read_preset(filename, entry.stat().st_mtime_ns)
+                presets.append({
+                    "name": preset_data["name"],
+                    "gains": preset_data["gains"]
+                })
+            except Exception as e:
+                logger.warning("Error reading preset %s: %s", filename, e)
     
     return presets
 
@@ -39,8 +70,7 @@ async def load_pid_preset(preset_name: str):
         raise HTTPException(status_code=404, detail="Preset not found")
     
     try:
-        with open(filepath, 'r') as f:
-            preset_data = json.load(f)
+        preset_data = _read_preset(filename)
         return {"gains": preset_data["gains"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading preset: {str(e)}")
@@ -48,15 +78,19 @@ async def load_pid_preset(preset_name: str):
 @router.post("/")
 async def save_pid_preset(request: SavePresetRequest):
     """Save a new PID preset"""
-
-    if (os.path.exists(PRESETS_DIR)):
-        filename = request.name
-        if not filename.endswith('.json'):
-            filename += '.json'
-        print(filename)
-            
-        filepath = os.path.join(PRESETS_DIR, filename)
-        with open(filepath, 'w') as json_file:
-            req_dict = {"name" : request.name, "gains" : request.gains}
-            json.dump(req_dict, json_file, indent=4) # indent=4 for pretty-printing
-        return {"ok": True}
+    filename = request.name
+    if not filename.endswith('.json'):
+        filename += '.json'
+    logger.debug("Saving preset %s", filename)
+        
+    filepath = os.path.join(PRESETS_DIR, filename)
+    req_dict = {"name" : request.name, "gains" : request.gains}
+    try:
+        with open(filepath, 'wb') as json_file:
+            json_file.write(orjson.dumps(req_dict, option=orjson.OPT_INDENT_2)) # Pretty-printed for hand editing
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Error saving preset: {str(e)}")
+    finally:
+        # Don't trust the mtime alone; a rewrite can land within its resolution
+        _preset_cache.pop(filename, None)
+    return {"ok": True}
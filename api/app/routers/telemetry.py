@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends
 from app.models.schemas import TelemetryOut
 from app.dependencies import get_controller, ControllerIO
+from app.pi_native_io import legacy_points_from_arrays
+from app.responses import ORJSONResponse, points_response
 
-router = APIRouter(prefix="", tags=["telemetry"])
+router = APIRouter(prefix="", tags=["telemetry"], default_response_class=ORJSONResponse)
 
 
-@router.get("/telemetry", response_model=TelemetryOut)
+@router.get("/telemetry", response_model=None, responses={200: {"model": TelemetryOut}})
 async def telemetry(controller: ControllerIO = Depends(get_controller)):
-    return {"points": controller.get_telemetry()}
+    # Points are built in TelemetryOut's shape chunk by chunk; skip per-point validation
+    return points_response(controller.get_telemetry_arrays(), legacy_points_from_arrays)
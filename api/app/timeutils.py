@@ -0,0 +1,24 @@
+"""
+Timestamp helpers shared by the API
+"""
+
+import time
+from datetime import datetime, timezone
+
+# Last (epoch milliseconds, ISO string) pair; stored as one tuple so readers on other
+# threads never see a torn update
+_last = (-1, "")
+
+
+def iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision and a Z suffix"""
+    global _last
+    # Reuse the string only within the same millisecond; a backwards clock step (NTP
+    # correction) lands on a different millisecond and is formatted afresh
+    ms = int(time.time() * 1000)
+    last_ms, last_s = _last
+    if ms == last_ms:
+        return last_s
+    s = datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    _last = (ms, s)
+    return s
@@ -9,26 +9,42 @@ import sys
 import os
 import math
 
+import numpy as np
+
 # Add pi_native to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'pi_native'))
 
 try:
     from pi_native.hardware.ads1115_manager import ADS1115Manager
-    from pi_native.hardware.thermistor_calc import ThermistorCalculator, ThermistorConfig, SteinhartHartCoefficients
+    from pi_native.hardware.thermistor_calc import (
+        ThermistorCalculator, SteinhartHartCoefficients, inv_t_to_celsius, steinhart_hart_inv_t
+    )
     from pi_native.config.hardware import hardware_config, PROBE_CHANNEL_MAP
 except ImportError as e:
     print(f"Error importing pi_native modules: {e}")
     sys.exit(1)
 
+# Bound once so the conversion helpers skip the math attribute lookup on every call
+_exp = math.exp
+_log = math.log
+
+# One calculator for the configured probes, built once rather than per debug call
+_CALC = ThermistorCalculator(supply_voltage=hardware_config.adc.supply_voltage)
+for _channel in PROBE_CHANNEL_MAP:
+    _CALC.set_probe_config(_channel, hardware_config.get_probe_config(_channel))
+
+def _c_to_f(temp_c):
+    """Celsius to Fahrenheit"""
+    return temp_c * 1.8 + 32.0
+
 def debug_thermistor_calculation(voltage, channel=0):
     """Debug a single thermistor calculation showing all intermediate steps"""
     print(f"\n=== Debug Calculation for Channel {channel} ===")
     print(f"Input voltage: {voltage:.3f}V")
     
     # Get configuration
-    calculator = ThermistorCalculator(supply_voltage=hardware_config.adc.supply_voltage)
-    config = hardware_config.get_probe_config(channel)
-    calculator.set_probe_config(channel, config)
+    calculator = _CALC
+    config = calculator.get_probe_config(channel)
     
     print(f"Supply voltage: {calculator.supply_voltage:.3f}V")
     print(f"Series resistor: {config.series_resistor}Ω")
@@ -42,18 +58,18 @@ def debug_thermistor_calculation(voltage, channel=0):
         
         # Step 2: Try Beta equation
         temp_beta = calculator.resistance_to_temperature_beta(resistance, config)
-        print(f"Beta equation temperature: {temp_beta:.1f}°C ({temp_beta * 9/5 + 32:.1f}°F)")
+        print(f"Beta equation temperature: {temp_beta:.1f}°C ({_c_to_f(temp_beta):.1f}°F)")
         
         # Step 3: Try Steinhart-Hart equation
         if config.steinhart_hart:
             temp_sh = calculator.resistance_to_temperature_steinhart_hart(resistance, config)
-            print(f"Steinhart-Hart temperature: {temp_sh:.1f}°C ({temp_sh * 9/5 + 32:.1f}°F)")
+            print(f"Steinhart-Hart temperature: {temp_sh:.1f}°C ({_c_to_f(temp_sh):.1f}°F)")
             
             # Show Steinhart-Hart calculation details
             coeff = config.steinhart_hart
             print(f"Steinhart-Hart coefficients: A={coeff.A}, B={coeff.B}, C={coeff.C}")
-            ln_r = math.log(resistance)
-            temp_kelvin_inv = coeff.A + coeff.B * ln_r + coeff.C * (ln_r ** 3)
+            ln_r = _log(resistance)
+            temp_kelvin_inv = steinhart_hart_inv_t(ln_r, coeff.A, coeff.B, coeff.C)
             temp_kelvin = 1.0 / temp_kelvin_inv
             print(f"ln(R) = {ln_r:.6f}")
             print(f"1/T = {temp_kelvin_inv:.9f}")
@@ -63,7 +79,7 @@ def debug_thermistor_calculation(voltage, channel=0):
         room_temp_c = 21.0  # ~70°F
         expected_resistance = calculate_expected_resistance(room_temp_c, config)
         expected_voltage = calculate_expected_voltage(expected_resistance, config.series_resistor, calculator.supply_voltage)
-        print(f"\nFor {room_temp_c}°C ({room_temp_c * 9/5 + 32:.1f}°F):")
+        print(f"\nFor {room_temp_c}°C ({_c_to_f(room_temp_c):.1f}°F):")
         print(f"Expected resistance: {expected_resistance:.0f}Ω")
         print(f"Expected voltage: {expected_voltage:.3f}V")
         
@@ -72,12 +88,8 @@ def debug_thermistor_calculation(voltage, channel=0):
 
 def calculate_expected_resistance(temp_c, config):
     """Calculate expected resistance for a given temperature using Beta equation"""
-    t_kelvin = temp_c + 273.15
-    t0_kelvin = config.temperature_nominal + 273.15
-    
-    # Beta equation: R = R0 * exp(B * (1/T - 1/T0))
-    resistance = config.resistance_nominal * math.exp(config.b_coefficient * (1/t_kelvin - 1/t0_kelvin))
-    return resistance
+    # Beta equation: R = R0 * exp(B * (1/T - 1/T0)) = R0 * exp(B/T - B/T0)
+    return config.resistance_nominal * _exp(config.b_coefficient / (temp_c + 273.15) - config.beta_over_t0)
 
 def calculate_expected_voltage(resistance, series_resistor, supply_voltage):
     """Calculate expected voltage for a given resistance"""
@@ -108,25 +120,23 @@ def test_different_coefficients():
     
     # Test with a voltage that should be room temperature
     test_voltage = 1.65  # Adjust this to your actual reading
+    series_resistor = 10000
     
-    for name, coeffs in thermistor_types.items():
-        config = ThermistorConfig(
-            name=name,
-            resistance_nominal=10000,
-            temperature_nominal=25.0,
-            b_coefficient=3950,
-            series_resistor=10000,
-            steinhart_hart=coeffs,
-            offset_c=0.0
-        )
-        
-        calculator = ThermistorCalculator(supply_voltage=3.3)
-        try:
-            resistance = calculator.voltage_to_resistance(test_voltage, config.series_resistor)
-            temp = calculator.resistance_to_temperature_steinhart_hart(resistance, config)
-            print(f"{name:20}: {temp:.1f}°C ({temp * 9/5 + 32:.1f}°F)")
-        except Exception as e:
+    calculator = ThermistorCalculator(supply_voltage=3.3)
+    try:
+        resistance = calculator.voltage_to_resistance(test_voltage, series_resistor)
+    except Exception as e:
+        for name in thermistor_types:
             print(f"{name:20}: ERROR - {e}")
+        return
+    
+    # Evaluate every coefficient set at once: rows of (A, B, C)
+    coeffs = np.array([(c.A, c.B, c.C) for c in thermistor_types.values()])
+    ln_r = _log(resistance)
+    temps = inv_t_to_celsius(steinhart_hart_inv_t(ln_r, coeffs[:, 0], coeffs[:, 1], coeffs[:, 2]))
+    
+    for name, temp, temp_f in zip(thermistor_types, temps.tolist(), _c_to_f(temps).tolist()):
+        print(f"{name:20}: {temp:.1f}°C ({temp_f:.1f}°F)")
 
 def main():
     print("Thermistor Debug Tool")
@@ -137,18 +147,23 @@ def main():
         adc_manager = ADS1115Manager(i2c_address=0x48, simulate=False)
         
         print("\nCurrent ADC readings:")
+        readings = adc_manager.read_all_channels()
+        channels = sorted(readings)
+        # Convert every channel that answered in one vectorized pass
+        temps = _CALC.voltages_to_temperatures_c([readings[ch].voltage for ch in channels], channels)
+        temps_by_channel = dict(zip(channels, temps.tolist()))
+        
         for channel in range(4):
             probe_name = PROBE_CHANNEL_MAP.get(channel, f"Channel_{channel}")
-            try:
-                reading = adc_manager.read_channel(channel)
-                if reading:
-                    print(f"Ch{channel} ({probe_name}): {reading.voltage:.3f}V")
-                    if channel == 0:  # Debug first channel in detail
-                        debug_thermistor_calculation(reading.voltage, channel)
-                else:
-                    print(f"Ch{channel} ({probe_name}): No reading")
-            except Exception as e:
-                print(f"Ch{channel} ({probe_name}): ERROR - {e}")
+            reading = readings.get(channel)
+            if reading:
+                temp_c = temps_by_channel[channel]
+                temp_text = "out of range" if temp_c != temp_c else f"{temp_c:.1f}°C ({_c_to_f(temp_c):.1f}°F)"
+                print(f"Ch{channel} ({probe_name}): {reading.voltage:.3f}V -> {temp_text}")
+                if channel == 0:  # Debug first channel in detail
+                    debug_thermistor_calculation(reading.voltage, channel)
+            else:
+                print(f"Ch{channel} ({probe_name}): No reading")
         
         adc_manager.close()
         
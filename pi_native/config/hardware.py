@@ -1,7 +1,9 @@
 """Hardware configuration for Pi-native EggBot"""
 
 from dataclasses import dataclass, field
-from typing import Dict
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional
 from pi_native.hardware.thermistor_calc import ThermistorConfig, SteinhartHartCoefficients
 
 @dataclass
@@ -31,6 +33,13 @@ class ServoConfig:
     max_speed: float = 30.0      # Degrees per second
     position_tolerance: float = 2.0  # Degrees
 
+# Steinhart-Hart coefficients shared by all of the stock probes
+_DEFAULT_SH = SteinhartHartCoefficients(
+    A=0.0007343140544,
+    B=0.0002157437229, 
+    C=0.0000000951568577
+)
+
 # Default thermistor configurations
 THERMISTOR_CONFIGS = {
     "pit_probe": ThermistorConfig(
@@ -39,11 +48,7 @@ THERMISTOR_CONFIGS = {
         temperature_nominal=25.0,
         b_coefficient=3950,
         series_resistor=10000,
-        steinhart_hart=SteinhartHartCoefficients(
-            A=0.0007343140544,
-            B=0.0002157437229, 
-            C=0.0000000951568577
-        ),
+        steinhart_hart=_DEFAULT_SH,
         offset_c=0.0
     ),
     
@@ -53,11 +58,7 @@ THERMISTOR_CONFIGS = {
         temperature_nominal=25.0,
         b_coefficient=3950,
         series_resistor=10000,
-        steinhart_hart=SteinhartHartCoefficients(
-            A=0.0007343140544,
-            B=0.0002157437229, 
-            C=0.0000000951568577
-        ),
+        steinhart_hart=_DEFAULT_SH,
         offset_c=0.0
     ),
     
@@ -67,11 +68,7 @@ THERMISTOR_CONFIGS = {
         temperature_nominal=25.0,
         b_coefficient=3950,
         series_resistor=10000,
-        steinhart_hart=SteinhartHartCoefficients(
-            A=0.0007343140544,
-            B=0.0002157437229, 
-            C=0.0000000951568577
-        ),
+        steinhart_hart=_DEFAULT_SH,
         offset_c=0.0
     ),
     
@@ -81,59 +78,90 @@ THERMISTOR_CONFIGS = {
         temperature_nominal=25.0,
         b_coefficient=3950,
         series_resistor=10000,
-        steinhart_hart=SteinhartHartCoefficients(
-            A=0.0007343140544,
-            B=0.0002157437229, 
-            C=0.0000000951568577
-        ),
+        steinhart_hart=_DEFAULT_SH,
         offset_c=0.0
     )
 }
 
-# Channel mapping for temperature probes
-PROBE_CHANNEL_MAP = {
-    0: "pit_probe",        # Channel 0 = Pit temperature
-    1: "meat_probe_1",     # Channel 1 = First meat probe  
-    2: "meat_probe_2",     # Channel 2 = Second meat probe
-    3: "ambient_probe"     # Channel 3 = Ambient temperature
+class ProbeChannel(IntEnum):
+    """ADC channel assignment for each temperature probe"""
+    PIT = 0        # Channel 0 = Pit temperature
+    MEAT1 = 1      # Channel 1 = First meat probe
+    MEAT2 = 2      # Channel 2 = Second meat probe
+    AMBIENT = 3    # Channel 3 = Ambient temperature
+
+    @property
+    def probe_name(self) -> str:
+        """Key of this probe in THERMISTOR_CONFIGS"""
+        return _PROBE_NAMES[self]
+
+_PROBE_NAMES = ("pit_probe", "meat_probe_1", "meat_probe_2", "ambient_probe")
+
+# Channel mapping for temperature probes (ProbeChannel keys compare equal to plain ints)
+PROBE_CHANNEL_MAP: Final[Dict[ProbeChannel, str]] = {
+    ProbeChannel.PIT: "pit_probe",
+    ProbeChannel.MEAT1: "meat_probe_1",
+    ProbeChannel.MEAT2: "meat_probe_2",
+    ProbeChannel.AMBIENT: "ambient_probe",
 }
 
 # Reverse mapping for convenience
-CHANNEL_PROBE_MAP = {v: k for k, v in PROBE_CHANNEL_MAP.items()}
+CHANNEL_PROBE_MAP: Final[Dict[str, ProbeChannel]] = {
+    "pit_probe": ProbeChannel.PIT,
+    "meat_probe_1": ProbeChannel.MEAT1,
+    "meat_probe_2": ProbeChannel.MEAT2,
+    "ambient_probe": ProbeChannel.AMBIENT,
+}
 
 @dataclass
 class HardwareConfig:
-    """Complete hardware configuration"""
+    """
+    Complete hardware configuration
+
+    Probe configs change through set_probe_config, which updates them in place.
+    thermistors is a live read-only view by probe name, kept for introspection.
+    """
     gpio: GPIOConfig = field(default_factory=GPIOConfig)
     adc: ADCConfig = field(default_factory=ADCConfig)
     servo: ServoConfig = field(default_factory=ServoConfig)
-    thermistors: Dict[str, ThermistorConfig] = None
+    thermistors: Optional[Mapping[str, ThermistorConfig]] = None
+    # Same configs indexed by ADC channel, so per-sample lookups skip the name mapping
+    _by_channel: List[ThermistorConfig] = field(init=False, repr=False, compare=False)
+    # Backing store behind the thermistors view
+    _by_name: Dict[str, ThermistorConfig] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.thermistors is None:
-            self.thermistors = THERMISTOR_CONFIGS.copy()
+        by_name = dict(THERMISTOR_CONFIGS if self.thermistors is None else self.thermistors)
+        missing = [name for name in _PROBE_NAMES if name not in by_name]
+        if missing:
+            raise ValueError(f"thermistors is missing configs for probes: {', '.join(missing)}")
+        
+        self._by_name = by_name
+        self._by_channel = [by_name[channel.probe_name] for channel in ProbeChannel]
+        self.thermistors = MappingProxyType(by_name)
     
     def get_probe_config(self, channel: int) -> ThermistorConfig:
         """Get thermistor config for a specific ADC channel"""
-        probe_name = PROBE_CHANNEL_MAP.get(channel)
-        if not probe_name:
+        if not 0 <= channel < len(self._by_channel):
             raise ValueError(f"Invalid channel {channel}")
         
-        return self.thermistors[probe_name]
+        return self._by_channel[channel]
     
     def set_probe_config(self, channel: int, config: ThermistorConfig) -> None:
         """Set thermistor config for a specific ADC channel"""
-        probe_name = PROBE_CHANNEL_MAP.get(channel)
-        if not probe_name:
+        if not 0 <= channel < len(self._by_channel):
             raise ValueError(f"Invalid channel {channel}")
         
-        self.thermistors[probe_name] = config
+        self._by_name[_PROBE_NAMES[channel]] = config
+        self._by_channel[channel] = config
     
-    def get_channel_for_probe(self, probe_name: str) -> int:
-        """Get ADC channel number for a probe name"""
+    def get_channel_for_probe(self, probe_name: str) -> ProbeChannel:
+        """Get ADC channel for a probe name ("pit_probe") or ProbeChannel member name ("PIT")"""
         channel = CHANNEL_PROBE_MAP.get(probe_name)
         if channel is None:
-            raise ValueError(f"Unknown probe name: {probe_name}")
+            channel = ProbeChannel.__members__.get(probe_name)
+            if channel is None:
+                raise ValueError(f"Unknown probe name: {probe_name}")
         return channel
 
 # Global hardware configuration instance
@@ -1,19 +1,31 @@
 """PID controller configuration for Pi-native EggBot"""
 
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple
 
-@dataclass
+class PIDTriple(NamedTuple):
+    """PID gains as a plain (kp, ki, kd) tuple with named fields"""
+    kp: float
+    ki: float
+    kd: float
+
+@dataclass(frozen=True, slots=True)
 class PIDGains:
     """PID controller gain values"""
     kp: float  # Proportional gain
     ki: float  # Integral gain  
     kd: float  # Derivative gain
+
+    # Built once; the gains are immutable, so every as_tuple() call can share it
+    _tuple: PIDTriple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_tuple", PIDTriple(self.kp, self.ki, self.kd))
     
-    def as_tuple(self) -> Tuple[float, float, float]:
-        return (self.kp, self.ki, self.kd)
+    def as_tuple(self) -> PIDTriple:
+        return self._tuple
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PIDLimits:
     """PID controller limits and constraints"""
     output_min: float = 0.0      # Minimum output value (0% damper)
@@ -22,6 +34,14 @@ class PIDLimits:
     integral_max: float = 150.0   # Integral windup limit (positive)
     derivative_filter: float = 0.1  # Low-pass filter for derivative term (0-1)
 
+    # Step constants derived from the limits above, computed once per limits object
+    feedforward: float = field(init=False, repr=False, compare=False)  # Baseline output, 25% of the range
+    derivative_keep: float = field(init=False, repr=False, compare=False)  # 1 - derivative_filter
+
+    def __post_init__(self):
+        object.__setattr__(self, "feedforward", (self.output_max - self.output_min) / 4.0 + self.output_min)
+        object.__setattr__(self, "derivative_keep", 1.0 - self.derivative_filter)
+
 @dataclass
 class PIDConfig:
     """Complete PID configuration"""
@@ -93,7 +113,7 @@ PID_PRESETS = {
     )
 }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyLimits:
     """Safety limits for temperature control"""
     max_pit_temp: float = 400.0     # Maximum pit temperature (°C)
@@ -1,7 +1,7 @@
 import time
 import threading
-from typing import Dict, Optional, List, Any
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Optional, List, Any, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import logging
 import csv
@@ -10,10 +10,34 @@ from pathlib import Path
 
 from pi_native.control.pid_controller import PIDController, PIDState
 from pi_native.control.temperature_monitor import TemperatureMonitor, TemperatureReading
+from pi_native.control.telemetry_buffer import TelemetryBuffer, points_from_arrays
 from pi_native.hardware.servo_controller import ServoController
-from pi_native.config.pid import PIDConfig, default_control_config, PID_PRESETS
+from pi_native.config.pid import PIDConfig, PIDTriple, default_control_config, PID_PRESETS
 from pi_native.config.hardware import hardware_config
 
+logger = logging.getLogger(__name__)
+
+# Damper travel limits in percent
+_DAMPER_MIN = 0.0
+_DAMPER_MAX = 100.0
+
+def _iso_ts(t: float) -> str:
+    """
+    Format epoch seconds as a UTC ISO 8601 string with microseconds and a Z suffix
+
+    Truncates to the microsecond the same way TelemetryBuffer stores timestamps, so a
+    point pushed to listeners and the same point read back from the buffer agree.
+    """
+    seconds, micros = divmod(int(t * 1_000_000), 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{micros:06d}Z"
+
+def _advance_deadline(deadline: float, interval: float, now: float) -> float:
+    """Next deadline one interval on; after an overrun, drop the missed frames and restart from now"""
+    deadline += interval
+    if deadline <= now:
+        deadline = now + interval
+    return deadline
+
 @dataclass
 class ControllerState:
     """Current state of the EggBot controller"""
@@ -39,23 +63,21 @@ class ControllerState:
     # System status
     system_enabled: bool = True
     safety_shutdown: bool = False
-    connected_probes: List[str] = None
-    
-    # Timestamps
-    timestamp: datetime = None
+    connected_probes: List[str] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-        if self.connected_probes is None:
-            self.connected_probes = []
+    # Timestamps (epoch seconds; formatted to ISO only when a status is served)
+    timestamp: float = field(default_factory=time.time)
+
+# ControllerState field names, in declaration order, for building status dicts
+_STATE_FIELDS = tuple(f.name for f in fields(ControllerState))
 
 class EggBotController:
     """Main controller that orchestrates all EggBot components"""
     
     def __init__(self, 
                  control_config: Optional[PIDConfig] = None,
-                 simulate: bool = False):
+                 simulate: bool = False,
+                 max_telemetry_points: int = 7200):
         
         self.simulate = simulate
         self.control_config = control_config or default_control_config
@@ -77,17 +99,30 @@ class EggBotController:
             pigpio_port=8888
         )
         
-        # Controller state
+        # Locks: _lock guards state, _status_version, _tick_time and the CSV settings;
+        # _telemetry_lock guards the telemetry buffer. Never hold both at once.
         self.state = ControllerState()
         self._lock = threading.Lock()
+        self._telemetry_lock = threading.Lock()
+
+        # Bumped (under _lock) on every control loop pass and on every setter, so API
+        # responses can be cached per version
+        self._status_version = 0
+
+        # Wall-clock time of the latest control tick; only formatted when a status reader asks
+        self._tick_time = time.time()
+        self._tick_iso_cache: Tuple[float, str] = (0.0, "")
         
         # Control loop threading
         self._running = False
         self._control_thread: Optional[threading.Thread] = None
+        # Set by stop() to wake the control loop out of its wait immediately
+        self._stop_event = threading.Event()
         
         # Telemetry data storage
-        self.telemetry_data: List[Dict[str, Any]] = []
-        self.max_telemetry_points = 7200  # ~2 hours at 1 second intervals
+        self.max_telemetry_points = max_telemetry_points  # Default is ~2 hours at 1 second intervals
+        self.telemetry = TelemetryBuffer(self.max_telemetry_points)
+        self.telemetry_callbacks: List[Callable[[Dict[str, Any]], None]] = []
         
         # Performance tracking
         self.control_loop_count = 0
@@ -108,23 +143,24 @@ class EggBotController:
         # Initialize setpoint
         self.pid_controller.set_setpoint(self.state.setpoint_c)
         
-        logging.info(f"EggBotController initialized (simulate={simulate})")
+        logger.info("EggBotController initialized (simulate=%s)", simulate)
     
     def _handle_temperature_alert(self, level: str, message: str) -> None:
         """Handle temperature alerts from the monitor"""
         if level == "CRITICAL":
-            logging.error(f"CRITICAL ALERT: {message}")
+            logger.error("CRITICAL ALERT: %s", message)
             self._emergency_shutdown()
         else:
-            logging.warning(f"Temperature Alert [{level}]: {message}")
+            logger.warning("Temperature Alert [%s]: %s", level, message)
     
     def _emergency_shutdown(self) -> None:
         """Emergency shutdown procedure"""
-        logging.error("EMERGENCY SHUTDOWN TRIGGERED")
+        logger.error("EMERGENCY SHUTDOWN TRIGGERED")
         
         with self._lock:
             self.state.safety_shutdown = True
             self.state.control_mode = "manual"
+            self._status_version += 1
         
         # Close damper immediately
         self.servo_controller.set_position_percent(0)
@@ -141,19 +177,25 @@ class EggBotController:
         self.temperature_monitor.start_monitoring()
         
         # Start control loop
+        self._stop_event.clear()
         self._running = True
         self._control_thread = threading.Thread(target=self._control_loop, daemon=True)
         self._control_thread.start()
         
-        logging.info("EggBotController started")
+        logger.info("EggBotController started")
     
     def stop(self) -> None:
         """Stop the controller"""
         self._running = False
+        self._stop_event.set()
         
         if self._control_thread and self._control_thread.is_alive():
             self._control_thread.join(timeout=3.0)
         
+        # system_enabled is part of the status bodies, and the stopped loop no longer bumps
+        with self._lock:
+            self._status_version += 1
+        
         # Stop temperature monitoring
         self.temperature_monitor.stop_monitoring()
 
@@ -162,37 +204,57 @@ class EggBotController:
             try:
                 self.stop_csv_logging()
             except Exception as e:
-                logging.error(f"Error stopping CSV logging: {e}")
+                logger.error("Error stopping CSV logging: %s", e)
 
         # Close damper and stop servo
         self.servo_controller.set_position_percent(0)
         time.sleep(0.5)
         self.servo_controller.close()
 
-        logging.info("EggBotController stopped")
+        logger.info("EggBotController stopped")
     
     def _control_loop(self) -> None:
         """Main control loop"""
-        last_control_time = 0.0
-        last_telemetry_time = 0.0
+        # Intervals are fixed for the controller's lifetime; resolve them and the
+        # per-tick callables once instead of on every pass. Waits go through the
+        # stop event so stop() doesn't have to sit out the rest of a sleep.
+        config = self.control_config
+        loop_dt = config.main_loop_interval
+        control_dt = config.control_loop_interval
+        # Telemetry rides on the control tick: log every Nth tick, N rounded to a whole
+        # number (5 with the default 1 s control / 5 s telemetry intervals)
+        telemetry_every = max(1, round(config.telemetry_interval / control_dt))
+        telemetry_countdown = 0
+        monotonic = time.monotonic
+        wall_time = time.time
+        wait_for_stop = self._stop_event.wait
+        update_temperatures = self._update_temperatures
+        run_pid_control = self._run_pid_control
+        log_telemetry = self._log_telemetry
+        
+        # Absolute wake-up deadlines on the monotonic clock, so the PID sees a steady dt
+        # and sleep overshoot doesn't accumulate
+        loop_deadline = control_deadline = monotonic()
         
         while self._running:
             try:
-                current_time = time.time()
+                now = monotonic()
+                current_time = wall_time()
                 
                 # Update temperatures
-                self._update_temperatures()
+                update_temperatures()
                 
                 # Run PID control at specified interval
-                if (current_time - last_control_time) >= self.control_config.control_loop_interval:
-                    self._run_pid_control()
-                    last_control_time = current_time
+                if now >= control_deadline:
+                    run_pid_control()
                     self.control_loop_count += 1
-                
-                # Log telemetry at specified interval
-                if (current_time - last_telemetry_time) >= self.control_config.telemetry_interval:
-                    self._log_telemetry()
-                    last_telemetry_time = current_time
+                    control_deadline = _advance_deadline(control_deadline, control_dt, now)
+                    
+                    # Log telemetry every telemetry_every control ticks, starting with the first
+                    if telemetry_countdown == 0:
+                        log_telemetry(current_time)
+                        telemetry_countdown = telemetry_every
+                    telemetry_countdown -= 1
 
                 # Log CSV data at specified interval
                 if (self.csv_logging_enabled and
@@ -200,31 +262,35 @@ class EggBotController:
                     self._log_csv_data()
                     self.csv_last_log_time = current_time
 
-                # Sleep until next cycle
-                time.sleep(self.control_config.main_loop_interval)
+                # Every pass moves the tick timestamp, loop and telemetry counters and probe
+                # statistics that status bodies include, so each pass is a new status version
+                with self._lock:
+                    self._status_version += 1
+
+                # Sleep until whichever deadline comes first
+                loop_deadline = _advance_deadline(loop_deadline, loop_dt, now)
+                sleep_for = min(loop_deadline, control_deadline) - monotonic()
+                if sleep_for > 0 and wait_for_stop(sleep_for):
+                    break
                 
             except Exception as e:
-                logging.error(f"Error in control loop: {e}")
-                time.sleep(1.0)
+                logger.error("Error in control loop: %s", e)
+                wait_for_stop(1.0)
     
     def _update_temperatures(self) -> None:
         """Update temperature readings from monitor"""
-        temps = self.temperature_monitor.get_current_temperatures()
-        connected = []
+        # Query the monitor in one call before taking the lock
+        temps, safety_shutdown, connected = self.temperature_monitor.get_snapshot()
+        tick_time = time.time()
         
         with self._lock:
+            self._tick_time = tick_time
             self.state.pit_temp_c = temps.get("pit_probe")
             self.state.meat_temp_1_c = temps.get("meat_probe_1") 
             self.state.meat_temp_2_c = temps.get("meat_probe_2")
             self.state.ambient_temp_c = temps.get("ambient_probe")
-            
-            # Update connected probes list
-            for probe_name, temp in temps.items():
-                if temp is not None:
-                    connected.append(probe_name)
-            
             self.state.connected_probes = connected
-            self.state.safety_shutdown = self.temperature_monitor.is_safety_shutdown()
+            self.state.safety_shutdown = safety_shutdown
     
     def _run_pid_control(self) -> None:
         """Run PID control calculation"""
@@ -233,29 +299,34 @@ class EggBotController:
                 self.state.safety_shutdown or
                 self.state.pit_temp_c is None):
                 return
+            pit_temp_c = self.state.pit_temp_c
+        
+        # Run PID calculation without holding the controller lock
+        pid_output = self.pid_controller.compute(pit_temp_c)
+        pid_state = self.pid_controller.get_state()
+        
+        with self._lock:
+            # A manual override or shutdown may have landed mid-computation; it wins
+            if self.state.control_mode != "automatic" or self.state.safety_shutdown:
+                return
             
-            # Run PID calculation
-            pid_output = self.pid_controller.compute(self.state.pit_temp_c)
-            
-            # Update servo position
+            # Update servo position (just a target store; the servo thread does the moving)
             self.servo_controller.set_position_percent(pid_output)
             
             # Update state
-            pid_state = self.pid_controller.get_state()
             self.state.pid_output = pid_output
             self.state.pid_error = pid_state.error
             self.state.damper_percent = self.servo_controller.get_position_percent()
     
-    def _log_telemetry(self) -> None:
-        """Log telemetry data point"""
-        with self._lock:
-            # Get PID component breakdown
-            pid_state = self.pid_controller.get_state()
-            pid_tuning = self.pid_controller.get_tuning_info()
+    def _log_telemetry(self, now: float) -> None:
+        """Log a telemetry data point stamped with epoch time now"""
+        # Get PID component breakdown (the PID controller has its own lock)
+        pid_tuning = self.pid_controller.get_tuning_info()
 
+        with self._lock:
             # Create telemetry data point
             data_point = {
-                "timestamp": datetime.now().isoformat() + "Z",
+                "timestamp": _iso_ts(now),
                 "pit_temp_c": self.state.pit_temp_c,
                 "meat_temp_1_c": self.state.meat_temp_1_c,
                 "meat_temp_2_c": self.state.meat_temp_2_c,
@@ -271,20 +342,56 @@ class EggBotController:
                 "control_mode": self.state.control_mode,
                 "safety_shutdown": self.state.safety_shutdown
             }
-            
-            self.telemetry_data.append(data_point)
-            
-            # Limit telemetry data size
-            if len(self.telemetry_data) > self.max_telemetry_points:
-                self.telemetry_data = self.telemetry_data[-self.max_telemetry_points:]
+        
+        with self._telemetry_lock:
+            # The ring buffer drops the oldest point once full
+            self.telemetry.append(data_point, now)
+
+        # Notify listeners outside the lock so a slow callback can't stall the API
+        for callback in self.telemetry_callbacks:
+            try:
+                callback(data_point)
+            except Exception as e:
+                logger.error("Error in telemetry callback: %s", e)
+
+    def add_telemetry_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Add callback invoked from the control loop with each new telemetry point"""
+        self.telemetry_callbacks.append(callback)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current controller status"""
         with self._lock:
-            state_dict = asdict(self.state)
-            state_dict["timestamp"] = datetime.now().isoformat() + "Z"
-            return state_dict
-    
+            state_dict = self._state_dict()
+        # The tick time is a single float and the ISO cache a single tuple, so no lock needed
+        state_dict["timestamp"] = self._tick_iso()
+        return state_dict
+    
+    def _state_dict(self) -> Dict[str, Any]:
+        """
+        Shallow copy of the controller state as a dict (caller holds the lock)
+
+        Same output as dataclasses.asdict, without its recursive deepcopy: every
+        field is an immutable scalar except connected_probes, which is copied.
+        """
+        state = self.state
+        state_dict = {name: getattr(state, name) for name in _STATE_FIELDS}
+        state_dict["connected_probes"] = list(state.connected_probes)
+        return state_dict
+    
+    def _tick_iso(self) -> str:
+        """UTC ISO timestamp of the latest control tick, formatted at most once per tick"""
+        tick_time = self._tick_time
+        cached_time, cached_iso = self._tick_iso_cache
+        if cached_time == tick_time:
+            return cached_iso
+        tick_iso = _iso_ts(tick_time)
+        self._tick_iso_cache = (tick_time, tick_iso)
+        return tick_iso
+
+    def get_status_version(self) -> int:
+        """Get a counter that changes whenever the controller status changes"""
+        return self._status_version
+
     def set_setpoint(self, setpoint_c: float) -> None:
         """Set pit temperature setpoint"""
         # Use configurable safety limits
@@ -293,19 +400,20 @@ class EggBotController:
 
         if not (min_temp <= setpoint_c <= max_temp):
             error_msg = f"Setpoint {setpoint_c}°C out of range [{min_temp}-{max_temp}]°C"
-            logging.warning(f"Invalid setpoint request: {error_msg}")
+            logger.warning("Invalid setpoint request: %s", error_msg)
             raise ValueError(error_msg)
 
         with self._lock:
             self.state.setpoint_c = setpoint_c
+            self._status_version += 1
 
         self.pid_controller.set_setpoint(setpoint_c)
-        logging.info(f"Setpoint set to {setpoint_c}°C (range: [{min_temp}-{max_temp}]°C)")
+        logger.info("Setpoint set to %s°C (range: [%s-%s]°C)", setpoint_c, min_temp, max_temp)
     
     def get_setpoint(self) -> float:
         """Get current pit temperature setpoint"""
-        with self._lock:
-            return self.state.setpoint_c
+        # Single attribute reads are atomic; the lock would only add contention with the loop
+        return self.state.setpoint_c
     
     def set_meat_setpoint(self, setpoint_c: Optional[float]) -> None:
         """Set meat temperature setpoint"""
@@ -316,23 +424,23 @@ class EggBotController:
 
             if not (min_temp <= setpoint_c <= max_temp):
                 error_msg = f"Meat setpoint {setpoint_c}°C out of range [{min_temp}-{max_temp}]°C"
-                logging.warning(f"Invalid meat setpoint request: {error_msg}")
+                logger.warning("Invalid meat setpoint request: %s", error_msg)
                 raise ValueError(error_msg)
 
         with self._lock:
             self.state.meat_setpoint_c = setpoint_c
+            self._status_version += 1
 
         if setpoint_c is not None:
-            min_temp = self.control_config.safety.min_meat_temp
-            max_temp = self.control_config.safety.max_meat_temp
-            logging.info(f"Meat setpoint set to {setpoint_c}°C (range: [{min_temp}-{max_temp}]°C)")
+            safety = self.control_config.safety
+            logger.info("Meat setpoint set to %s°C (range: [%s-%s]°C)",
+                        setpoint_c, safety.min_meat_temp, safety.max_meat_temp)
         else:
-            logging.info("Meat setpoint cleared (set to None)")
+            logger.info("Meat setpoint cleared (set to None)")
     
     def get_meat_setpoint(self) -> Optional[float]:
         """Get current meat temperature setpoint"""
-        with self._lock:
-            return self.state.meat_setpoint_c
+        return self.state.meat_setpoint_c
 
     def get_temperature_limits(self) -> Dict[str, Dict[str, float]]:
         """Get current temperature limits from configuration"""
@@ -402,16 +510,17 @@ class EggBotController:
     
     def set_damper_percent(self, percent: float) -> None:
         """Set damper position manually (switches to manual mode)"""
-        percent = max(0, min(100, percent))
+        percent = min(max(percent, _DAMPER_MIN), _DAMPER_MAX)
         
         with self._lock:
             self.state.control_mode = "manual"
             self.state.damper_percent = percent
+            self._status_version += 1
         
         self.servo_controller.set_position_percent(percent)
         self.pid_controller.set_auto_mode(False)
         
-        logging.info(f"Manual damper set to {percent}%")
+        logger.info("Manual damper set to %s%%", percent)
     
     def set_control_mode(self, mode: str) -> None:
         """Set control mode: 'manual' or 'automatic'"""
@@ -423,6 +532,7 @@ class EggBotController:
                 raise ValueError("Cannot switch to automatic mode during safety shutdown")
             
             self.state.control_mode = mode
+            self._status_version += 1
         
         if mode == "automatic":
             self.pid_controller.set_auto_mode(True)
@@ -430,12 +540,11 @@ class EggBotController:
         else:
             self.pid_controller.set_auto_mode(False)
         
-        logging.info(f"Control mode set to {mode}")
+        logger.info("Control mode set to %s", mode)
     
     def get_control_mode(self) -> str:
         """Get current control mode"""
-        with self._lock:
-            return self.state.control_mode
+        return self.state.control_mode
     
     def set_pid_gains(self, kp: float, ki: float, kd: float) -> None:
         """Set PID controller gains"""
@@ -443,10 +552,11 @@ class EggBotController:
         
         with self._lock:
             self.state.pid_gains = (kp, ki, kd)
+            self._status_version += 1
         
-        logging.info(f"PID gains set to Kp={kp}, Ki={ki}, Kd={kd}")
+        logger.info("PID gains set to Kp=%s, Ki=%s, Kd=%s", kp, ki, kd)
     
-    def get_pid_gains(self) -> tuple:
+    def get_pid_gains(self) -> PIDTriple:
         """Get current PID gains"""
         return self.pid_controller.get_gains()
     
@@ -458,7 +568,7 @@ class EggBotController:
         preset = PID_PRESETS[preset_name]
         self.set_pid_gains(preset.gains.kp, preset.gains.ki, preset.gains.kd)
         
-        logging.info(f"Loaded PID preset: {preset_name}")
+        logger.info("Loaded PID preset: %s", preset_name)
     
     def get_available_presets(self) -> List[str]:
         """Get list of available PID presets"""
@@ -489,15 +599,22 @@ class EggBotController:
     
     def get_telemetry(self) -> List[Dict[str, Any]]:
         """Get telemetry data"""
-        with self._lock:
-            return self.telemetry_data.copy()
+        with self._telemetry_lock:
+            arrays = self.telemetry.arrays()
+        # The arrays are a read-only snapshot, so the per-point formatting can run unlocked
+        return points_from_arrays(arrays)
+
+    def get_telemetry_arrays(self) -> Dict[str, Any]:
+        """Get telemetry as column arrays (see TelemetryBuffer.arrays), oldest point first"""
+        with self._telemetry_lock:
+            return self.telemetry.arrays()
     
     def clear_telemetry(self) -> None:
         """Clear telemetry data"""
-        with self._lock:
-            self.telemetry_data.clear()
+        with self._telemetry_lock:
+            self.telemetry.clear()
         
-        logging.info("Telemetry data cleared")
+        logger.info("Telemetry data cleared")
     
     def get_pid_tuning_info(self) -> Dict[str, Any]:
         """Get PID tuning information"""
@@ -505,15 +622,35 @@ class EggBotController:
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get controller performance statistics"""
-        pid_stats = self.pid_controller.get_performance_stats()
-        
+        return self._performance_stats(self.pid_controller.get_performance_stats())
+
+    def _performance_stats(self, pid_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the performance stats dict around already-fetched PID stats"""
         return {
             "pid_controller": pid_stats,
             "control_loop_count": self.control_loop_count,
-            "telemetry_points": len(self.telemetry_data),
+            "telemetry_points": len(self.telemetry),
             "connected_probes": len(self.state.connected_probes),
             "uptime_seconds": time.time() - self.last_control_time if self.last_control_time else 0
         }
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Get status, probe status and performance stats in one call
+
+        Status and the controller counters are read under a single lock
+        acquisition, so they describe the same control tick.
+
+        Returns:
+            Dict with "status", "probes" and "perf" entries
+        """
+        probes = self.get_probe_status()
+        pid_stats = self.pid_controller.get_performance_stats()
+        with self._lock:
+            status = self._state_dict()
+            status["timestamp"] = self._tick_iso()
+            perf = self._performance_stats(pid_stats)
+        return {"status": status, "probes": probes, "perf": perf}
     
     def reset_safety_shutdown(self) -> None:
         """Reset safety shutdown (after resolving the issue)"""
@@ -521,8 +658,9 @@ class EggBotController:
         
         with self._lock:
             self.state.safety_shutdown = False
+            self._status_version += 1
         
-        logging.info("Safety shutdown reset")
+        logger.info("Safety shutdown reset")
     
     def is_running(self) -> bool:
         """Check if controller is running"""
@@ -580,7 +718,7 @@ class EggBotController:
                 self.csv_start_time = time.time()
                 self.csv_last_log_time = 0.0
 
-            logging.info(f"CSV logging started: {csv_path} (interval: {interval_seconds}s)")
+            logger.info("CSV logging started: %s (interval: %ss)", csv_path, interval_seconds)
 
         except Exception as e:
             # Clean up on error
@@ -609,7 +747,7 @@ class EggBotController:
         self.csv_file_path = None
         self.csv_start_time = None
 
-        logging.info(f"CSV logging stopped: {file_path}")
+        logger.info("CSV logging stopped: %s", file_path)
         return file_path
 
     def get_csv_logging_status(self) -> Dict[str, Any]:
@@ -665,7 +803,7 @@ class EggBotController:
             self.csv_file_handle.flush()  # Ensure data is written immediately
 
         except Exception as e:
-            logging.error(f"Error writing to CSV: {e}")
+            logger.error("Error writing to CSV: %s", e)
             # Don't stop logging on individual write errors
 
     def __enter__(self):
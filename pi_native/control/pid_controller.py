@@ -1,12 +1,13 @@
 import time
 import threading
-from typing import Optional, Tuple, List
-from dataclasses import dataclass
+from collections import deque
+from typing import Deque, Optional, Tuple
+from dataclasses import dataclass, replace
 import logging
 
-from pi_native.config.pid import PIDGains, PIDLimits, PIDConfig
+from pi_native.config.pid import PIDGains, PIDLimits, PIDConfig, PIDTriple
 
-@dataclass
+@dataclass(slots=True)
 class PIDState:
     """Current state of the PID controller"""
     setpoint: float = 0.0
@@ -39,8 +40,8 @@ class PIDController:
         self.last_compute_time = 0.0
         
         # Error history for derivative filtering
-        self.error_history: List[float] = []
         self.max_error_history = 5
+        self.error_history: Deque[float] = deque(maxlen=self.max_error_history)
         
         # Performance tracking
         self.compute_count = 0
@@ -54,10 +55,10 @@ class PIDController:
             self.gains = PIDGains(kp=kp, ki=ki, kd=kd)
             logging.info(f"PID gains updated: Kp={kp}, Ki={ki}, Kd={kd}")
     
-    def get_gains(self) -> Tuple[float, float, float]:
+    def get_gains(self) -> PIDTriple:
         """Get current PID gains"""
-        with self._lock:
-            return self.gains.as_tuple()
+        # set_gains swaps in a new immutable PIDGains, so reading the reference needs no lock
+        return self.gains.as_tuple()
     
     def set_setpoint(self, setpoint: float) -> None:
         """Set the desired setpoint"""
@@ -155,7 +156,7 @@ class PIDController:
                 # Apply low-pass filter to derivative term
                 if self.error_history:
                     filtered_derivative = (self.limits.derivative_filter * derivative_raw + 
-                                         (1 - self.limits.derivative_filter) * self.state.derivative)
+                                         self.limits.derivative_keep * self.state.derivative)
                 else:
                     filtered_derivative = derivative_raw
                 
@@ -165,8 +166,7 @@ class PIDController:
                 derivative = 0.0
             
             # Calculate output
-            feedforward = (self.limits.output_max - self.limits.output_min) / 4.0 + self.limits.output_min
-            output = feedforward + proportional + integral + derivative
+            output = self.limits.feedforward + proportional + integral + derivative
             
             # Apply output limits
             output = max(self.limits.output_min, min(self.limits.output_max, output))
@@ -175,10 +175,8 @@ class PIDController:
             self.state.output = output
             self.state.last_error = error
             
-            # Update error history for derivative filtering
+            # Update error history for derivative filtering (the deque drops the oldest entry)
             self.error_history.append(error)
-            if len(self.error_history) > self.max_error_history:
-                self.error_history.pop(0)
             
             # Performance tracking
             compute_time = time.perf_counter() - start_time
@@ -209,8 +207,8 @@ class PIDController:
             raise ValueError("min_output must be less than max_output")
         
         with self._lock:
-            self.limits.output_min = min_output
-            self.limits.output_max = max_output
+            # Replace rather than mutate: the limits object may be shared with a preset
+            self.limits = replace(self.limits, output_min=min_output, output_max=max_output)
             
             # Clamp current output to new limits
             self.state.output = max(min_output, min(max_output, self.state.output))
@@ -223,8 +221,7 @@ class PIDController:
             raise ValueError("min_integral must be less than max_integral")
         
         with self._lock:
-            self.limits.integral_min = min_integral
-            self.limits.integral_max = max_integral
+            self.limits = replace(self.limits, integral_min=min_integral, integral_max=max_integral)
             
             # Clamp current integral to new limits
             self.state.integral = max(min_integral, min(max_integral, self.state.integral))
@@ -0,0 +1,130 @@
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+# Numeric telemetry columns, in the order they appear in a telemetry point
+FLOAT_FIELDS = (
+    "pit_temp_c",
+    "meat_temp_1_c",
+    "meat_temp_2_c",
+    "ambient_temp_c",
+    "setpoint_c",
+    "meat_setpoint_c",
+    "damper_percent",
+    "pid_output",
+    "pid_error",
+    "pid_proportional",
+    "pid_integral",
+    "pid_derivative",
+)
+
+# control_mode is stored as an index into this tuple
+CONTROL_MODES = ("manual", "automatic")
+
+POINT_FIELDS = ("timestamp",) + FLOAT_FIELDS + ("control_mode", "safety_shutdown")
+
+
+class TelemetryBuffer:
+    """
+    Fixed-capacity ring buffer of telemetry points stored column-wise in numpy arrays
+
+    Missing temperatures are stored as NaN and come back out as None. The buffer
+    is not thread-safe; the owner serializes access.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype="datetime64[us]")
+        self._floats = {name: np.full(capacity, np.nan) for name in FLOAT_FIELDS}
+        self._control_mode = np.zeros(capacity, dtype=np.uint8)
+        self._safety_shutdown = np.zeros(capacity, dtype=np.bool_)
+        self._head = 0  # Next slot to write
+        self._size = 0
+        # Read-only copy of the live columns, reused by arrays() until the next write
+        self._snapshot: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, point: Mapping[str, Any], timestamp: Optional[float] = None) -> None:
+        """
+        Store a telemetry point, overwriting the oldest one when full
+
+        Args:
+            point: Mapping with the FLOAT_FIELDS, control_mode and safety_shutdown keys
+            timestamp: Epoch seconds of the point (defaults to now)
+        """
+        i = self._head
+        if timestamp is None:
+            timestamp = time.time()
+        self._timestamps[i] = np.datetime64(int(timestamp * 1_000_000), "us")
+        for name, column in self._floats.items():
+            value = point.get(name)
+            column[i] = np.nan if value is None else value
+        self._control_mode[i] = CONTROL_MODES.index(point.get("control_mode", "manual"))
+        self._safety_shutdown[i] = bool(point.get("safety_shutdown", False))
+
+        self._head = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self._snapshot = None
+
+    def clear(self) -> None:
+        """Drop all stored points"""
+        self._head = 0
+        self._size = 0
+        self._snapshot = None
+
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """Copy of a column's live entries, oldest first"""
+        if self._size < self.capacity:
+            return column[:self._size].copy()
+        return np.concatenate((column[self._head:], column[:self._head]))
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Snapshot of every column, oldest point first
+
+        The arrays are read-only and shared between callers until the next
+        append or clear, so repeated reads between telemetry ticks copy nothing.
+
+        Returns:
+            New dict of column name to array; timestamp is datetime64[us] (UTC),
+            control_mode holds indices into CONTROL_MODES
+        """
+        if self._snapshot is None:
+            arrays = {"timestamp": self._ordered(self._timestamps)}
+            for name, column in self._floats.items():
+                arrays[name] = self._ordered(column)
+            arrays["control_mode"] = self._ordered(self._control_mode)
+            arrays["safety_shutdown"] = self._ordered(self._safety_shutdown)
+            for column in arrays.values():
+                column.flags.writeable = False
+            self._snapshot = arrays
+        return dict(self._snapshot)
+
+    def to_points(self) -> List[Dict[str, Any]]:
+        """Materialize the buffer as a list of telemetry point dicts, oldest first"""
+        return points_from_arrays(self.arrays())
+
+
+def column_to_list(column: np.ndarray) -> List[Optional[float]]:
+    """Convert a float column to a list, mapping NaN to None"""
+    values = column.tolist()
+    if np.isnan(column).any():
+        return [None if v != v else v for v in values]
+    return values
+
+
+def timestamps_to_iso(timestamps: np.ndarray) -> List[str]:
+    """Format a datetime64 column as UTC ISO 8601 strings with a Z suffix"""
+    return np.char.add(np.datetime_as_string(timestamps, unit="us"), "Z").tolist()
+
+
+def points_from_arrays(arrays: Mapping[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Build telemetry point dicts from TelemetryBuffer.arrays() output"""
+    columns = [timestamps_to_iso(arrays["timestamp"])]
+    columns.extend(column_to_list(arrays[name]) for name in FLOAT_FIELDS)
+    columns.append([CONTROL_MODES[m] for m in arrays["control_mode"].tolist()])
+    columns.append(arrays["safety_shutdown"].tolist())
+    return [dict(zip(POINT_FIELDS, row)) for row in zip(*columns)]
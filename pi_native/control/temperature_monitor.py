@@ -1,6 +1,9 @@
+import math
 import time
 import threading
-from typing import Dict, Optional, List, Callable
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -10,7 +13,7 @@ from pi_native.hardware.thermistor_calc import ThermistorCalculator
 from pi_native.config.hardware import hardware_config, PROBE_CHANNEL_MAP
 from pi_native.config.pid import SafetyLimits
 
-@dataclass
+@dataclass(slots=True)
 class TemperatureReading:
     """Temperature reading with metadata"""
     channel: int
@@ -21,7 +24,7 @@ class TemperatureReading:
     is_valid: bool = True
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProbeStatus:
     """Status information for a temperature probe"""
     probe_name: str
@@ -34,7 +37,7 @@ class ProbeStatus:
     average_temp: float = 0.0
     min_temp: float = float('inf')
     max_temp: float = float('-inf')
-    temperature_history: List[float] = field(default_factory=list)
+    temperature_history: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
 
 class TemperatureMonitor:
     """Monitors multiple temperature probes and provides safety features"""
@@ -119,18 +122,22 @@ class TemperatureMonitor:
     
     def _monitor_loop(self) -> None:
         """Main monitoring loop"""
+        # Absolute wake-up deadline on the monotonic clock, so sleep overshoot doesn't accumulate
+        next_tick = time.monotonic()
         while self._running:
             try:
-                start_time = time.time()
-                
                 # Read all channels
                 readings = self.adc.read_all_channels()
                 
-                # Process each reading
+                # Convert all channels' voltages in one batch, then process each reading
                 temp_readings: Dict[str, TemperatureReading] = {}
+                channels = list(readings)
+                temps = self.calculator.voltages_to_temperatures_c(
+                    [readings[channel].voltage for channel in channels], channels
+                ).tolist()
                 
-                for channel, adc_reading in readings.items():
-                    temp_reading = self._process_reading(channel, adc_reading)
+                for channel, temp_c in zip(channels, temps):
+                    temp_reading = self._process_reading(channel, readings[channel], None if math.isnan(temp_c) else temp_c)
                     if temp_reading:
                         probe_name = PROBE_CHANNEL_MAP[channel]
                         temp_readings[probe_name] = temp_reading
@@ -142,24 +149,24 @@ class TemperatureMonitor:
                     
                     self._check_safety()
                 
-                # Maintain loop timing
-                elapsed = time.time() - start_time
-                sleep_time = max(0, self.update_interval - elapsed)
-                time.sleep(sleep_time)
+                # Maintain loop timing; after an overrun, skip the missed ticks instead of bursting
+                next_tick += self.update_interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick = now
+                time.sleep(next_tick - now)
                 
             except Exception as e:
                 logging.error(f"Error in temperature monitor loop: {e}")
                 time.sleep(1.0)  # Error recovery delay
     
-    def _process_reading(self, channel: int, adc_reading: ProbeReading) -> Optional[TemperatureReading]:
-        """Process ADC reading into temperature reading"""
+    def _process_reading(self, channel: int, adc_reading: ProbeReading, temp_c: Optional[float]) -> Optional[TemperatureReading]:
+        """Process ADC reading and its converted temperature (None if conversion failed) into a temperature reading"""
         try:
             probe_name = PROBE_CHANNEL_MAP[channel]
             
-            # Convert voltage to temperature
-            temp_c = self.calculator.voltage_to_temperature(adc_reading.voltage, channel)
-            
             if temp_c is None:
+                logging.warning(f"Temperature calculation error for channel {channel}: invalid voltage {adc_reading.voltage}V")
                 return TemperatureReading(
                     channel=channel,
                     probe_name=probe_name,
@@ -227,10 +234,8 @@ class TemperatureMonitor:
             probe.min_temp = min(probe.min_temp, reading.temperature_c)
             probe.max_temp = max(probe.max_temp, reading.temperature_c)
             
-            # Update temperature history (keep last 100 readings)
+            # Update temperature history (the deque keeps the last 100 readings)
             probe.temperature_history.append(reading.temperature_c)
-            if len(probe.temperature_history) > 100:
-                probe.temperature_history.pop(0)
             
             # Calculate rolling average
             if probe.temperature_history:
@@ -261,14 +266,14 @@ class TemperatureMonitor:
                                   f"Pit temperature {pit_temp:.1f}°C approaching maximum")
             
             # Check temperature rate of change
-            if len(pit_probe.temperature_history) >= 2:
-                recent_temps = pit_probe.temperature_history[-10:]  # Last 10 readings
-                if len(recent_temps) >= 2:
-                    temp_rate = (recent_temps[-1] - recent_temps[0]) / (len(recent_temps) * self.update_interval / 60.0)  # °C/min
-                    
-                    if temp_rate > self.safety_limits.temp_rate_limit:
-                        self._trigger_alert("WARNING", 
-                                          f"Temperature rising rapidly: {temp_rate:.1f}°C/min")
+            history = pit_probe.temperature_history
+            if len(history) >= 2:
+                window = min(len(history), 10)  # Last 10 readings
+                temp_rate = (history[-1] - history[-window]) / (window * self.update_interval / 60.0)  # °C/min
+                
+                if temp_rate > self.safety_limits.temp_rate_limit:
+                    self._trigger_alert("WARNING", 
+                                      f"Temperature rising rapidly: {temp_rate:.1f}°C/min")
         
         # Check for disconnected probes
         for probe_name, probe in self.probes.items():
@@ -290,6 +295,25 @@ class TemperatureMonitor:
                     temps[probe_name] = None
             return temps
     
+    def get_snapshot(self) -> Tuple[Dict[str, Optional[float]], bool, List[str]]:
+        """
+        Get current temperatures, the safety shutdown flag and connected probes in one call
+        
+        Returns:
+            (temperatures by probe name, safety shutdown, names of probes with a valid reading),
+            all read under one lock acquisition
+        """
+        with self._lock:
+            temps = {}
+            connected = []
+            for probe_name, probe in self.probes.items():
+                reading = probe.last_reading
+                temp = reading.temperature_c if reading and reading.is_valid else None
+                temps[probe_name] = temp
+                if temp is not None:
+                    connected.append(probe_name)
+            return temps, self.safety_shutdown, connected
+    
     def get_probe_status(self, probe_name: str) -> Optional[ProbeStatus]:
         """Get status for a specific probe"""
         with self._lock:
@@ -351,7 +375,7 @@ class TemperatureMonitor:
         if len(history) < samples_needed:
             return "insufficient_data"
         
-        recent_temps = history[-samples_needed:]
+        recent_temps = list(islice(history, len(history) - samples_needed, None))
         start_temp = sum(recent_temps[:3]) / 3  # Average of first 3
         end_temp = sum(recent_temps[-3:]) / 3   # Average of last 3
         
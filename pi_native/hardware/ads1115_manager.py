@@ -57,7 +57,7 @@ _try_import_smbus()
 
 HARDWARE_AVAILABLE = BLINKA_AVAILABLE or SMBUS_AVAILABLE
 
-@dataclass
+@dataclass(slots=True)
 class ProbeReading:
     channel: int
     voltage: float
@@ -22,8 +22,9 @@ class ServoController:
         self.simulate = simulate or not PIGPIO_AVAILABLE
         self.pigpio_host = pigpio_host
         self.pigpio_port = pigpio_port
-        self._lock = threading.Lock()
         self._pi = None
+        # Each position has a single writer (the control loop owns _current_position,
+        # callers own _target_position), and attribute stores are atomic, so no lock is needed
         self._current_position = 0  # Current servo position (0-100%)
         self._target_position = 0   # Target servo position
         self._last_pulse_width = 0  # Last PWM pulse width sent
@@ -235,34 +236,29 @@ class ServoController:
         """Set servo position as percentage (0-100%)"""
         percent = max(0, min(100, percent))
         
-        with self._lock:
-            self._target_position = percent
+        self._target_position = percent
             
         logging.debug(f"Servo target position set to {percent}%")
     
     def get_position_percent(self) -> float:
         """Get current servo position as percentage"""
-        with self._lock:
-            return self._current_position
+        return self._current_position
     
     def get_target_position_percent(self) -> float:
         """Get target servo position as percentage"""
-        with self._lock:
-            return self._target_position
+        return self._target_position
     
     def is_at_target(self) -> bool:
         """Check if servo is at target position within tolerance"""
-        with self._lock:
-            diff = abs(self._current_position - self._target_position)
-            return diff <= self.position_tolerance
+        diff = abs(self._current_position - self._target_position)
+        return diff <= self.position_tolerance
     
     def _position_control_loop(self) -> None:
         """Background thread for smooth servo movement"""
         while self._running:
             try:
-                with self._lock:
-                    current = self._current_position
-                    target = self._target_position
+                current = self._current_position
+                target = self._target_position
                 
                 if abs(current - target) > self.position_tolerance:
                     # Calculate movement step based on max speed
@@ -279,8 +275,7 @@ class ServoController:
                     pulse_width = self._percent_to_pulse_width(new_position)
                     self._set_pwm(pulse_width)
                     
-                    with self._lock:
-                        self._current_position = new_position
+                    self._current_position = new_position
                     
                     logging.debug(f"Servo moved to {new_position:.1f}% (pulse: {pulse_width}μs)")
 
@@ -1,17 +1,19 @@
 import math
-from typing import Optional, Dict, NamedTuple
-from dataclasses import dataclass
+from typing import Optional, Dict, List, NamedTuple, Sequence, Tuple
+from dataclasses import dataclass, field, replace
 import logging
 
+import numpy as np
+
 class SteinhartHartCoefficients(NamedTuple):
     """Steinhart-Hart equation coefficients for thermistor temperature calculation"""
     A: float
     B: float  
     C: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThermistorConfig:
-    """Configuration for a thermistor probe"""
+    """Configuration for a thermistor probe (immutable; use dataclasses.replace to change it)"""
     name: str
     resistance_nominal: int  # Nominal resistance at 25°C (usually 10kΩ)
     temperature_nominal: float  # Temperature for nominal resistance (usually 25°C)
@@ -20,6 +22,42 @@ class ThermistorConfig:
     steinhart_hart: Optional[SteinhartHartCoefficients] = None
     offset_c: float = 0.0  # Calibration offset in Celsius
 
+    # Beta-equation constants derived from the fields above, computed once per config
+    inv_t0: float = field(init=False, repr=False, compare=False)  # 1/T0 in 1/K
+    log_r0: float = field(init=False, repr=False, compare=False)  # ln(R0)
+    inv_b: float = field(init=False, repr=False, compare=False)   # 1/B
+    beta_over_t0: float = field(init=False, repr=False, compare=False)  # B/T0
+
+    def __post_init__(self):
+        object.__setattr__(self, "inv_t0", 1.0 / (self.temperature_nominal + 273.15))
+        object.__setattr__(self, "log_r0", math.log(self.resistance_nominal))
+        object.__setattr__(self, "inv_b", 1.0 / self.b_coefficient)
+        object.__setattr__(self, "beta_over_t0", self.b_coefficient * self.inv_t0)
+
+# Conversion formulas shared by the scalar and batch paths. Each works on floats and
+# on numpy arrays alike, so a formula or calibration fix only has to be made here.
+
+def divider_resistance(voltage, supply_voltage, series_resistor):
+    """
+    Thermistor resistance from the divider output voltage
+    
+    Vout = Vcc * R_thermistor / (R_series + R_thermistor), so
+    R_thermistor = R_series * Vcc / Vout - R_series.
+    """
+    return series_resistor * supply_voltage / voltage - series_resistor
+
+def steinhart_hart_inv_t(ln_r, a, b, c):
+    """Steinhart-Hart 1/T = A + B*ln(R) + C*ln(R)^3 in 1/K, evaluated in Horner form"""
+    return a + ln_r * (b + c * ln_r * ln_r)
+
+def beta_inv_t(ln_r, inv_t0, log_r0, inv_b):
+    """Beta equation 1/T = 1/T0 + (1/B)*ln(R/R0) in 1/K"""
+    return inv_t0 + (ln_r - log_r0) * inv_b
+
+def inv_t_to_celsius(inv_t, offset_c=0.0):
+    """Convert 1/T (1/K) to Celsius and apply a calibration offset"""
+    return 1.0 / inv_t - 273.15 + offset_c
+
 class ThermistorCalculator:
     """Handles temperature calculations for NTC thermistors"""
     
@@ -54,6 +92,9 @@ class ThermistorCalculator:
     def __init__(self, supply_voltage: float = 3.3):
         self.supply_voltage = supply_voltage
         self.probe_configs: Dict[int, ThermistorConfig] = {}
+        # Per-channel conversion parameters, rebuilt after config changes: an array for the
+        # batch path and the same values as per-channel float tuples for the scalar path
+        self._channel_params: Optional[Tuple[np.ndarray, List[Tuple[float, ...]]]] = None
         
         # Set default configuration for all channels
         for channel in range(4):
@@ -65,6 +106,7 @@ class ThermistorCalculator:
             raise ValueError(f"Invalid channel {channel}. Must be 0-3")
         
         self.probe_configs[channel] = config
+        self._channel_params = None
         logging.info(f"Channel {channel} configured for {config.name}")
     
     def get_probe_config(self, channel: int) -> ThermistorConfig:
@@ -76,23 +118,12 @@ class ThermistorCalculator:
         if voltage <= 0.001 or voltage >= self.supply_voltage:
             raise ValueError(f"Invalid voltage {voltage}V (supply: {self.supply_voltage}V)")
         
-        # Voltage divider: Vout = Vcc * R_thermistor / (R_series + R_thermistor)
-        # Solving for R_thermistor: R_thermistor = R_series * Vout / (Vcc - Vout)
-        resistance = series_resistor * self.supply_voltage / voltage - series_resistor
-        return resistance
+        return divider_resistance(voltage, self.supply_voltage, series_resistor)
     
     def resistance_to_temperature_beta(self, resistance: float, config: ThermistorConfig) -> float:
         """Convert resistance to temperature using Beta equation (simpler but less accurate)"""
-        # Beta equation: T = 1/(1/T0 + (1/B)*ln(R/R0))
-        # Where T is in Kelvin, T0 is nominal temp in Kelvin
-        
-        t0_kelvin = config.temperature_nominal + 273.15
-        ln_ratio = math.log(resistance / config.resistance_nominal)
-        
-        temp_kelvin = 1.0 / (1.0/t0_kelvin + ln_ratio/config.b_coefficient)
-        temp_celsius = temp_kelvin - 273.15
-        
-        return temp_celsius + config.offset_c
+        inv_t = beta_inv_t(math.log(resistance), config.inv_t0, config.log_r0, config.inv_b)
+        return inv_t_to_celsius(inv_t, config.offset_c)
     
     def resistance_to_temperature_steinhart_hart(self, resistance: float, config: ThermistorConfig) -> float:
         """Convert resistance to temperature using Steinhart-Hart equation (more accurate)"""
@@ -100,21 +131,22 @@ class ThermistorCalculator:
             # Fall back to Beta equation if no Steinhart-Hart coefficients
             return self.resistance_to_temperature_beta(resistance, config)
         
-        # Steinhart-Hart equation: 1/T = A + B*ln(R) + C*(ln(R))^3
-        # Where T is in Kelvin
-        
         coeff = config.steinhart_hart
-        ln_r = math.log(resistance)
-        
-        temp_kelvin_inv = coeff.A + coeff.B * ln_r + coeff.C * (ln_r ** 3)
-        temp_kelvin = 1.0 / temp_kelvin_inv
-        temp_celsius = temp_kelvin - 273.15
-        
-        return temp_celsius + config.offset_c
+        inv_t = steinhart_hart_inv_t(math.log(resistance), coeff.A, coeff.B, coeff.C)
+        return inv_t_to_celsius(inv_t, config.offset_c)
     
     def voltage_to_temperature(self, voltage: float, channel: int, use_steinhart_hart: bool = True) -> Optional[float]:
         """Convert ADC voltage directly to temperature for a specific channel"""
         try:
+            if use_steinhart_hart and 0 <= channel < 4:
+                if voltage <= 0.001 or voltage >= self.supply_voltage:
+                    raise ValueError(f"Invalid voltage {voltage}V (supply: {self.supply_voltage}V)")
+                # Same cached parameters as the batch path, as plain floats
+                series, a, b, c, has_sh, inv_t0, log_r0, inv_b, offset = self._get_channel_params()[1][channel]
+                ln_r = math.log(divider_resistance(voltage, self.supply_voltage, series))
+                inv_t = steinhart_hart_inv_t(ln_r, a, b, c) if has_sh else beta_inv_t(ln_r, inv_t0, log_r0, inv_b)
+                return inv_t_to_celsius(inv_t, offset)
+            
             config = self.get_probe_config(channel)
             
             # Convert voltage to resistance
@@ -132,10 +164,77 @@ class ThermistorCalculator:
             logging.warning(f"Temperature calculation error for channel {channel}: {e}")
             return None
     
+    def _get_channel_params(self) -> Tuple[np.ndarray, List[Tuple[float, ...]]]:
+        """
+        Conversion parameters for channels 0-3, built once per config change
+
+        The parameters are series resistor, Steinhart-Hart A, B, C, has-Steinhart-Hart
+        flag, 1/T0, ln(R0), 1/B and calibration offset.
+
+        Returns:
+            (array with one row per parameter and one column per channel,
+             list with one tuple of the parameters per channel)
+        """
+        if self._channel_params is None:
+            rows = []
+            for channel in range(4):
+                config = self.get_probe_config(channel)
+                coeff = config.steinhart_hart or SteinhartHartCoefficients(0.0, 0.0, 0.0)
+                rows.append((config.series_resistor, coeff.A, coeff.B, coeff.C,
+                             config.steinhart_hart is not None,
+                             config.inv_t0, config.log_r0, config.inv_b, config.offset_c))
+            # Transpose into C order so each parameter is one contiguous row across channels
+            array = np.ascontiguousarray(np.array(rows, dtype=np.float64).T)
+            self._channel_params = (array, [tuple(column) for column in array.T.tolist()])
+        return self._channel_params
+    
+    def voltages_to_temperatures_c(self, voltages: Sequence[float], channels: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Convert several channels' ADC voltages to temperatures in one vectorized pass
+        
+        Each channel uses Steinhart-Hart when its config has coefficients and the Beta
+        equation otherwise, matching voltage_to_temperature.
+        
+        Args:
+            voltages: One voltage per channel
+            channels: Channel of each voltage (defaults to 0, 1, 2, ...)
+            
+        Returns:
+            Temperatures in Celsius; NaN where the voltage is outside the divider's range
+            
+        Raises:
+            ValueError: If the voltages don't match the channels one-to-one, or a
+                channel is outside 0-3
+        """
+        v = np.asarray(voltages, dtype=np.float64)
+        params = self._get_channel_params()[0]
+        channel_count = params.shape[1]
+        if channels is None:
+            if v.ndim != 1 or len(v) > channel_count:
+                raise ValueError(f"Expected at most {channel_count} voltages, got shape {v.shape}")
+            params = params[:, :len(v)]
+        else:
+            channels = list(channels)
+            if v.shape != (len(channels),):
+                raise ValueError(f"Got {v.size} voltages for {len(channels)} channels")
+            if any(not 0 <= channel < channel_count for channel in channels):
+                raise ValueError(f"Channels must be in 0-{channel_count - 1}, got {channels}")
+            params = params[:, channels]
+        series, a, b, c, has_sh, inv_t0, log_r0, inv_b, offset = params
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ln_r = np.log(divider_resistance(v, self.supply_voltage, series))
+            inv_t = np.where(has_sh != 0.0, steinhart_hart_inv_t(ln_r, a, b, c), beta_inv_t(ln_r, inv_t0, log_r0, inv_b))
+            temps = inv_t_to_celsius(inv_t, offset)
+        
+        temps[(v <= 0.001) | (v >= self.supply_voltage)] = np.nan
+        return temps
+    
     def calibrate_probe(self, channel: int, measured_temp: float, actual_temp: float) -> None:
         """Calibrate a probe by setting offset based on known temperature"""
-        config = self.get_probe_config(channel)
-        config.offset_c = actual_temp - measured_temp
+        config = replace(self.get_probe_config(channel), offset_c=actual_temp - measured_temp)
+        self.probe_configs[channel] = config
+        self._channel_params = None
         logging.info(f"Channel {channel} calibrated with offset {config.offset_c:.2f}°C")
     
     def get_temperature_range(self, config: ThermistorConfig) -> tuple[float, float]:
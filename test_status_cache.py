@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Status cache test script for Pi-native EggBot
+Checks that every control loop pass and every controller setter invalidates the
+cached status bodies and ETags, and that clients sending the current ETag get a 304
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+
+# Run the API in simulation mode against this checkout
+os.environ.setdefault("SIMULATE", "true")
+sys.path.insert(0, '.')
+sys.path.insert(0, 'api')
+
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.main import app
+from app.dependencies import get_controller
+from app.responses import VersionedJSONCache
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def _request(if_none_match=None) -> Request:
+    """Bare GET request, optionally carrying an If-None-Match header"""
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/status", "headers": headers})
+
+def test_versioned_cache():
+    """Test VersionedJSONCache reuse, invalidation and the 304 path"""
+    print("\n=== Testing VersionedJSONCache ===")
+
+    try:
+        cache = VersionedJSONCache()
+        builds = []
+
+        def build():
+            builds.append(len(builds))
+            return {"build": len(builds)}
+
+        first = cache.respond(_request(), 1, build)
+        again = cache.respond(_request(), 1, build)
+        assert len(builds) == 1, "same version should reuse the encoded body"
+        assert first.body == again.body and first.headers["etag"] == again.headers["etag"]
+        print(f"Version 1: {first.body.decode()} ETag {first.headers['etag']}")
+
+        not_modified = cache.respond(_request(first.headers["etag"]), 1, build)
+        assert not_modified.status_code == 304 and not_modified.body == b""
+        assert not_modified.headers["etag"] == first.headers["etag"] and len(builds) == 1
+        print("Matching If-None-Match: 304 without rebuilding")
+
+        second = cache.respond(_request(first.headers["etag"]), 2, build)
+        assert second.status_code == 200 and len(builds) == 2
+        assert second.headers["etag"] != first.headers["etag"] and second.body != first.body
+        print(f"Version 2 with stale ETag: {second.body.decode()} ETag {second.headers['etag']}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"VersionedJSONCache test failed: {e!r}")
+        return False
+
+def test_tick_invalidation():
+    """Test that cached bodies with per-tick fields follow the running control loop"""
+    print("\n=== Testing per-tick invalidation ===")
+
+    try:
+        with TestClient(app) as client:
+            first = {path: client.get(path) for path in ("/pi/system/status", "/pi/temperatures", "/pi/safety/status")}
+            # Long enough for at least one control tick (1 s) and several loop passes
+            time.sleep(1.5)
+
+            for path, before in first.items():
+                after = client.get(path, headers={"If-None-Match": before.headers["etag"]})
+                assert after.status_code == 200, f"{path}: stale ETag answered with {after.status_code}"
+                assert after.headers["etag"] != before.headers["etag"], f"{path}: ETag unchanged"
+                print(f"{path:<20}: ETag {before.headers['etag']} -> {after.headers['etag']}")
+
+            before = first["/pi/system/status"].json()
+            after = client.get("/pi/system/status").json()
+            assert after["control_loop_count"] > before["control_loop_count"], "control_loop_count is stale"
+            assert client.get("/pi/temperatures").json()["timestamp"] > first["/pi/temperatures"].json()["timestamp"]
+            print(f"control_loop_count: {before['control_loop_count']} -> {after['control_loop_count']}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Per-tick invalidation test failed: {e!r}")
+        return False
+
+def test_status_endpoint():
+    """Test that each setter yields a new /status ETag and an up-to-date body"""
+    print("\n=== Testing /status invalidation ===")
+
+    try:
+        with TestClient(app) as client:
+            return _check_setters(client)
+
+    except Exception as e:
+        logger.error(f"/status invalidation test failed: {e!r}")
+        return False
+
+def _check_setters(client: TestClient) -> bool:
+    """Drive every setter through the API and check /status after each one"""
+    controller = asyncio.run(get_controller())
+    # Stop the control and monitoring loops so only the setters below move the version
+    controller.controller.stop()
+
+    setters = [
+        ("setpoint", "/setpoint", {"setpoint_c": 121.0}, ("setpoint_c", 121.0)),
+        ("meat setpoint", "/meat_setpoint", {"meat_setpoint_c": 63.0}, ("meat_setpoint_c", 63.0)),
+        ("control mode", "/control_mode", {"control_mode": "automatic"}, ("control_mode", "automatic")),
+        ("damper", "/damper", {"damper_percent": 40}, ("damper_percent", 40)),
+        # Gains aren't part of /status, and a reset without a shutdown leaves the body as it
+        # was; both still move the version, so clients refetch
+        ("pid gains", "/pid_gains", {"pid_gains": [3.0, 0.2, 1.5]}, None),
+        ("safety reset", "/pi/safety/reset", None, ("safety_shutdown", False)),
+    ]
+
+    previous = client.get("/status")
+    assert previous.status_code == 200
+
+    for name, path, payload, expected in setters:
+        assert client.post(path, json=payload).status_code == 200, f"{name} request failed"
+
+        # The old ETag must no longer match
+        current = client.get("/status", headers={"If-None-Match": previous.headers["etag"]})
+        assert current.status_code == 200, f"{name}: stale ETag still answered with {current.status_code}"
+        assert current.headers["etag"] != previous.headers["etag"], f"{name}: ETag unchanged"
+
+        body = current.json()
+        assert body == controller.get_status(), f"{name}: cached body is stale"
+        if expected is not None:
+            field, value = expected
+            assert body[field] == value, f"{name}: {field}={body[field]!r}, expected {value!r}"
+        print(f"{name:<15}: ETag {current.headers['etag']}")
+        previous = current
+
+    # Nothing changed since the last poll, so the current ETag gets a 304
+    not_modified = client.get("/status", headers={"If-None-Match": previous.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == previous.headers["etag"]
+    print("Unchanged status with current ETag: 304")
+
+    return True
+
+def main():
+    """Run all status cache tests"""
+    print("EggBot Status Cache Test")
+    print("=" * 45)
+
+    results = [
+        ("VersionedJSONCache", test_versioned_cache()),
+        # Before the setter test, which stops the control loop
+        ("Per-tick invalidation", test_tick_invalidation()),
+        ("/status invalidation", test_status_endpoint()),
+    ]
+
+    # Summary
+    print("\n" + "=" * 45)
+    print("TEST SUMMARY:")
+    print("=" * 45)
+
+    for test_name, success in results:
+        status = "PASS" if success else "FAIL"
+        print(f"{test_name:<25}: {status}")
+
+    passed = sum(1 for _, success in results if success)
+    total = len(results)
+    print(f"\nPassed: {passed}/{total}")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Telemetry buffer test script for Pi-native EggBot
+Tests the numpy ring buffer, point conversion and the legacy /telemetry shape
+"""
+
+import os
+import sys
+import logging
+
+import numpy as np
+
+# Run the API in simulation mode against this checkout
+os.environ.setdefault("SIMULATE", "true")
+sys.path.insert(0, '.')
+sys.path.insert(0, 'api')
+
+from pi_native.control.telemetry_buffer import (
+    CONTROL_MODES, FLOAT_FIELDS, POINT_FIELDS, TelemetryBuffer, points_from_arrays,
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 2026-01-01T00:00:00Z, so expected ISO strings are easy to write out
+BASE_TIME = 1767225600.0
+
+def _point(i: int) -> dict:
+    """Telemetry point whose values all derive from i"""
+    point = {name: float(i) for name in FLOAT_FIELDS}
+    point["control_mode"] = CONTROL_MODES[i % 2]
+    point["safety_shutdown"] = i % 3 == 0
+    return point
+
+def test_wraparound():
+    """Test that a full buffer keeps the newest points, oldest first"""
+    print("\n=== Testing ring buffer wraparound ===")
+
+    try:
+        buffer = TelemetryBuffer(4)
+        for i in range(3):
+            buffer.append(_point(i), BASE_TIME + i)
+        assert len(buffer) == 3
+        assert buffer.arrays()["pit_temp_c"].tolist() == [0.0, 1.0, 2.0]
+        print(f"Partly filled: {buffer.arrays()['pit_temp_c'].tolist()}")
+
+        # Ten points through a capacity of four: only 6-9 survive, in order
+        for i in range(3, 10):
+            buffer.append(_point(i), BASE_TIME + i)
+        arrays = buffer.arrays()
+        assert len(buffer) == 4
+        for name in FLOAT_FIELDS:
+            assert arrays[name].tolist() == [6.0, 7.0, 8.0, 9.0], f"{name} out of order"
+        assert arrays["control_mode"].tolist() == [0, 1, 0, 1]
+        assert arrays["safety_shutdown"].tolist() == [True, False, False, True]
+        expected_times = (np.datetime64(int(BASE_TIME), "s") + np.arange(6, 10)).astype("datetime64[us]")
+        assert (arrays["timestamp"] == expected_times).all()
+        print(f"After wraparound: {arrays['pit_temp_c'].tolist()}")
+
+        buffer.clear()
+        assert len(buffer) == 0 and buffer.arrays()["pit_temp_c"].size == 0
+        buffer.append(_point(42), BASE_TIME)
+        assert buffer.arrays()["pit_temp_c"].tolist() == [42.0]
+        print("Clear then append: [42.0]")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Wraparound test failed: {e!r}")
+        return False
+
+def test_snapshot():
+    """Test that arrays() snapshots are read-only and shared until the next write"""
+    print("\n=== Testing array snapshots ===")
+
+    try:
+        buffer = TelemetryBuffer(3)
+        buffer.append(_point(1), BASE_TIME)
+        first = buffer.arrays()
+        second = buffer.arrays()
+        assert first is not second and first["pit_temp_c"] is second["pit_temp_c"]
+
+        try:
+            first["pit_temp_c"][0] = 99.0
+            raise AssertionError("snapshot arrays should be read-only")
+        except ValueError:
+            pass
+
+        buffer.append(_point(2), BASE_TIME + 1)
+        third = buffer.arrays()
+        assert third["pit_temp_c"] is not first["pit_temp_c"]
+        assert first["pit_temp_c"].tolist() == [1.0], "old snapshot changed after a write"
+        assert third["pit_temp_c"].tolist() == [1.0, 2.0]
+        print("Snapshots are read-only, reused between writes and replaced after one")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Snapshot test failed: {e!r}")
+        return False
+
+def test_points_from_arrays():
+    """Test conversion of buffer columns back to telemetry point dicts"""
+    print("\n=== Testing points_from_arrays ===")
+
+    try:
+        buffer = TelemetryBuffer(2)
+        missing = _point(1)
+        missing["meat_temp_1_c"] = None  # Disconnected probe
+        buffer.append(missing, BASE_TIME + 0.25)
+        buffer.append(_point(2), BASE_TIME + 1)
+
+        points = points_from_arrays(buffer.arrays())
+        assert points == buffer.to_points()
+        assert [tuple(point) for point in points] == [POINT_FIELDS] * 2
+        assert points[0]["timestamp"] == "2026-01-01T00:00:00.250000Z"
+        assert points[1]["timestamp"] == "2026-01-01T00:00:01.000000Z"
+        assert points[0]["meat_temp_1_c"] is None and points[0]["pit_temp_c"] == 1.0
+        assert points[1]["meat_temp_1_c"] == 2.0
+        assert [point["control_mode"] for point in points] == ["automatic", "manual"]
+        assert [point["safety_shutdown"] for point in points] == [False, False]
+        print(f"First point: {points[0]}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"points_from_arrays test failed: {e!r}")
+        return False
+
+def test_legacy_telemetry():
+    """Test that legacy /telemetry points carry the stored values"""
+    print("\n=== Testing legacy telemetry shape ===")
+
+    controller = None
+    try:
+        from app.pi_native_io import PiNativeControllerIO
+
+        controller = PiNativeControllerIO()
+        controller.controller.stop()
+        controller.controller.clear_telemetry()
+        for i in (1, 2):
+            controller.controller.telemetry.append(_point(i), BASE_TIME + i)
+
+        points = controller.get_telemetry()
+        assert [point["control_mode"] for point in points] == ["automatic", "manual"]
+        assert [point["meat_temp_2_c"] for point in points] == [1.0, 2.0]
+        assert [point["pid_output"] for point in points] == [1.0, 2.0]
+        assert all(point["connected_probes"] == [] for point in points)
+        assert points[0]["meat_temp_c"] == points[0]["meat_temp_1_c"] == 1.0
+        print(f"Legacy point: {points[0]}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Legacy telemetry test failed: {e!r}")
+        return False
+    finally:
+        if controller is not None:
+            controller.controller.stop()
+
+def main():
+    """Run all telemetry buffer tests"""
+    print("EggBot Telemetry Buffer Test")
+    print("=" * 45)
+
+    tests = [
+        ("Wraparound", test_wraparound),
+        ("Snapshots", test_snapshot),
+        ("points_from_arrays", test_points_from_arrays),
+        ("Legacy telemetry", test_legacy_telemetry),
+    ]
+    results = [(test_name, test_func()) for test_name, test_func in tests]
+
+    # Summary
+    print("\n" + "=" * 45)
+    print("TEST SUMMARY:")
+    print("=" * 45)
+
+    for test_name, success in results:
+        status = "PASS" if success else "FAIL"
+        print(f"{test_name:<25}: {status}")
+
+    passed = sum(1 for _, success in results if success)
+    total = len(results)
+    print(f"\nPassed: {passed}/{total}")
+    return 0 if passed == total else 1
+
+if __name__ == "__main__":
+    sys.exit(main())